@@ -0,0 +1,64 @@
+import argparse
+import builtins
+import collections
+import os
+import sys
+import tempfile
+
+from streamlit.testing.v1 import AppTest
+
+from common import ROOT, use_root
+from pomodoro import storage
+
+# ===== rerun 마다 읽는 정적 파일 =====
+# 진입 스크립트를 AppTest 로 여러 번 다시 실행하면서 CSS/이미지 파일을 몇 번 여는지 센다.
+# 처음 실행에서 한 번씩 읽고 나면 이후 rerun 에서는 0 이어야 한다 (POMODORO_DEV=1 이면 mtime 확인만).
+#
+#   python benchmarks/asset_reads.py --runs 20
+SCRIPTS = ["app.py", "최종디자인.py", "test.py", "feature-img_btn.py"]
+ASSETS = (".css", ".png")
+
+
+def count_reads(script, runs):
+    reads = collections.Counter()
+    real_open = builtins.open
+
+    def counting_open(file, *args, **kwargs):
+        if isinstance(file, str) and file.endswith(ASSETS):
+            reads[os.path.basename(file)] += 1
+        return real_open(file, *args, **kwargs)
+
+    at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=60)
+    builtins.open = counting_open
+    try:
+        at.run()
+        first = sum(reads.values())
+        reads.clear()
+        for _ in range(runs):
+            at.run()
+    finally:
+        builtins.open = real_open
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return first, sum(reads.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="rerun 마다 CSS/이미지 파일을 읽는 횟수")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("scripts", nargs="*", default=SCRIPTS)
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as folder:
+        storage.DATA_PATH = os.path.join(folder, "user_sessions.json")
+        use_root()
+        for script in args.scripts:
+            first, later = count_reads(script, args.runs)
+            failed |= later > 0
+            print(f"{script}: 첫 실행 {first}번, 이후 rerun {args.runs}번 동안 {later}번")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
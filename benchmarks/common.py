@@ -0,0 +1,14 @@
+import os
+import sys
+
+# ===== 벤치마크 공통 준비 =====
+# 벤치마크는 python benchmarks/<이름>.py 로 실행하므로 저장소 루트를 import 경로에 넣는다.
+# 각 벤치마크는 pomodoro 를 가져오기 전에 이 모듈을 먼저 가져온다 (from common import ROOT).
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+# AppTest 로 진입 스크립트를 돌리기 전에 부른다 (style.css 등 상대 경로)
+def use_root():
+    os.chdir(ROOT)
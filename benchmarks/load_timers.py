@@ -0,0 +1,296 @@
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from tornado.websocket import websocket_connect
+
+from common import ROOT
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+# ===== 동시 타이머 부하 테스트 =====
+# 로컬에서 app.py 로 Streamlit 서버를 띄우고, 브라우저 대신 웹소켓 클라이언트 N 개를 붙여
+# 각자 타이머를 돌린다 (집중 --focus 초, 휴식 --break 초, 3세션, 끝나면 다시 시작).
+# 클라이언트는 브라우저가 하는 일만 한다: 처음 실행, 시간 입력 + 시작 버튼, 그리고 서버가 알려 준
+# 주기(auto_rerun, POMODORO_CHECK_SECONDS = --interval)마다 타이머 영역(fragment) 다시 실행 요청.
+# 단계 전환은 서버가 이 주기 확인에서 마감 시각이 지난 것을 보고 처리한다.
+#
+# N 을 --steps 순서대로 늘리면서 단계마다 --hold 초 동안 잰다.
+#   서버 프로세스: CPU(한 코어 기준 %), RSS, 스레드 수  (/proc/<pid>/stat, status)
+#   주기 확인(틱): 지연(요청 -> 끝남), 간격 흔들림(|끝난 간격 - 주기|), 놓친 틱(지연 > 주기)
+#   단계 전환 수 (토스트 알림으로 센다)
+# 한계(saturation): 처음으로 놓친 틱 > 1%, 또는 지연 p95 > 주기의 절반, 또는 CPU > 90% 가 된 N.
+# 네트워크 없이 한 대의 리눅스에서 돈다. 기록은 임시 폴더에 복사한 트리에 ?user=loadNNN 별로 쌓인다.
+#
+#   python benchmarks/load_timers.py --steps 1 10 25 50 100 --hold 20 --interval 1
+START = "▶️ 타이머 시작"
+SATURATION = {"missed": 0.01, "latency": 0.5, "cpu": 90.0}
+PHASE_TOASTS = ("집중 완료", "쉬는 시간이 끝났습니다")
+
+
+class Client:
+    def __init__(self, url, index, focus, brk):
+        self.url = url
+        self.user = f"load{index:03d}"
+        self.durations = {"": focus, " ": brk}  # 라벨 접미사 -> 초 (집중 입력은 접미사 없음, 휴식은 " ")
+        self.ws = None
+        self.widgets = {}        # id -> WidgetState (브라우저처럼 매번 전부 보낸다)
+        self.start_id = None
+        self.auto = None         # (주기, fragment id)
+        self.sent = []           # 응답을 기다리는 틱 요청 시각
+        self.last_finish = None
+        self.ticks = []          # (끝난 시각, 지연, 간격 또는 None)
+        self.transitions = []    # 단계 전환 시각
+        self.errors = 0
+
+    async def send(self, fragment_id="", trigger=None):
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = f"user={self.user}"
+        state.page_script_hash = ""
+        state.widget_states.widgets.extend(self.widgets.values())
+        if trigger:
+            state.widget_states.widgets.append(WidgetState(id=trigger, trigger_value=True))
+        if fragment_id:
+            state.fragment_id = fragment_id
+            state.is_auto_rerun = True
+        await self.ws.write_message(msg.SerializeToString(), binary=True)
+
+    # 처음 실행에서 시간 입력/시작 버튼 id 를 찾는다
+    def _element(self, element):
+        kind = element.WhichOneof("type")
+        if kind == "number_input":
+            label = element.number_input.label
+            suffix = " " if label.endswith(" ") else ""
+            if label.strip() in ("Hours", "Minutes", "Seconds") and element.number_input.id not in self.widgets:
+                value = {"Hours": 0, "Minutes": 0, "Seconds": self.durations[suffix]}[label.strip()]
+                self.widgets[element.number_input.id] = WidgetState(id=element.number_input.id, double_value=value)
+        elif kind == "button" and element.button.label == START:
+            self.start_id = element.button.id
+        elif kind == "toast" and element.toast.body.startswith(PHASE_TOASTS):
+            self.transitions.append(time.monotonic())
+
+    async def _finished(self, status):
+        now = time.monotonic()
+        if status == ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY and self.sent:
+            interval = now - self.last_finish if self.last_finish is not None else None
+            self.ticks.append((now, now - self.sent.pop(0), interval))
+            self.last_finish = now
+        elif status == ForwardMsg.FINISHED_SUCCESSFULLY and self.auto is None:
+            # 타이머가 서 있다 (처음, 또는 모든 세션 완료) -> 시간을 넣고 다시 시작
+            if self.start_id is None:
+                raise RuntimeError("시작 버튼을 찾지 못했습니다")
+            await self.send(trigger=self.start_id)
+
+    async def _tick(self, stop):
+        due = None
+        while not stop.is_set():
+            if self.auto is None:
+                due = None
+                await asyncio.sleep(0.05)
+                continue
+            interval, fragment_id = self.auto
+            due = (due or time.monotonic()) + interval
+            await asyncio.sleep(max(0.0, due - time.monotonic()))
+            if self.auto is not None and not stop.is_set():
+                self.sent.append(time.monotonic())
+                await self.send(fragment_id)
+
+    async def run(self, stop):
+        self.ws = await websocket_connect(self.url, max_message_size=64 * 1024 * 1024)
+        ticker = asyncio.ensure_future(self._tick(stop))
+        await self.send()
+        try:
+            while not stop.is_set():
+                try:
+                    raw = await asyncio.wait_for(self.ws.read_message(), 1.0)
+                except asyncio.TimeoutError:
+                    continue
+                if raw is None:
+                    self.errors += 1
+                    break
+                msg = ForwardMsg()
+                msg.ParseFromString(raw)
+                kind = msg.WhichOneof("type")
+                if kind == "new_session" and not msg.new_session.fragment_ids_this_run:
+                    # 전체 실행이 시작되면 브라우저는 주기 실행을 지운다 (fragment 만 다시 실행할 때는 그대로)
+                    self.auto, self.sent, self.last_finish = None, [], None
+                elif kind == "auto_rerun":
+                    self.auto = (msg.auto_rerun.interval, msg.auto_rerun.fragment_id)
+                elif kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                    self._element(msg.delta.new_element)
+                elif kind == "script_finished":
+                    await self._finished(msg.script_finished)
+        finally:
+            ticker.cancel()
+            self.ws.close()
+
+
+# ===== 서버 프로세스 (/proc) =====
+def proc_sample(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")  # utime + stime
+    rss = threads = 0
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                rss = int(line.split()[1]) * 1024
+            elif line.startswith("Threads:"):
+                threads = int(line.split()[1])
+    return time.monotonic(), cpu, rss, threads
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# 저장소 트리를 임시 폴더에 복사해서 띄운다 (기록 파일이 저장소에 쌓이지 않도록)
+def start_server(folder, port, interval):
+    tree = os.path.join(folder, "tree")
+    shutil.copytree(ROOT, tree, ignore=shutil.ignore_patterns(
+        ".git", "users", "user_sessions*", "results", "__pycache__"))
+    env = dict(os.environ, POMODORO_CHECK_SECONDS=str(interval))
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "app.py", "--server.headless", "true",
+         "--server.port", str(port), "--server.address", "127.0.0.1", "--server.fileWatcherType", "none",
+         "--browser.gatherUsageStats", "false"],
+        cwd=tree, env=env, stdout=subprocess.DEVNULL, stderr=open(os.path.join(folder, "server.log"), "w"))
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("서버가 뜨지 않았습니다")
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def step_report(n, clients, samples, since, interval):
+    (t0, cpu0, _, _), (t1, cpu1, rss, threads) = samples[0], samples[-1]
+    ticks = [t for c in clients for t in c.ticks if t[0] >= since]
+    latencies = [t[1] for t in ticks]
+    jitters = [abs(t[2] - interval) for t in ticks if t[2] is not None]
+    missed = sum(1 for t in ticks if t[1] > interval)
+    return {
+        "timers": n,
+        "cpu_percent": (cpu1 - cpu0) / (t1 - t0) * 100,
+        "rss_mb": rss / 2 ** 20,
+        "threads": threads,
+        "max_threads": max(s[3] for s in samples),
+        "ticks_per_second": len(ticks) / (t1 - t0),
+        "latency_p50_ms": (statistics.median(latencies) * 1000) if latencies else None,
+        "latency_p95_ms": (percentile(latencies, 0.95) * 1000) if latencies else None,
+        "jitter_p95_ms": (percentile(jitters, 0.95) * 1000) if jitters else None,
+        "missed_ratio": missed / len(ticks) if ticks else None,
+        "transitions": sum(1 for c in clients for t in c.transitions if t >= since),
+        "disconnects": sum(c.errors for c in clients),
+    }
+
+
+def saturated(report, interval):
+    return ((report["missed_ratio"] or 0) > SATURATION["missed"]
+            or (report["latency_p95_ms"] or 0) > SATURATION["latency"] * interval * 1000
+            or report["cpu_percent"] > SATURATION["cpu"]
+            or report["disconnects"] > 0)
+
+
+async def ramp(url, pid, args):
+    stop = asyncio.Event()
+    clients, tasks, reports = [], [], []
+    for n in args.steps:
+        while len(clients) < n:
+            client = Client(url, len(clients) + 1, args.focus, args.brk)
+            clients.append(client)
+            tasks.append(asyncio.ensure_future(client.run(stop)))
+        # 새로 붙은 클라이언트가 자리 잡을 때까지 기다린 뒤부터 잰다
+        await asyncio.sleep(args.warmup)
+        since = time.monotonic()
+        samples = [proc_sample(pid)]
+        while time.monotonic() - since < args.hold:
+            await asyncio.sleep(0.5)
+            samples.append(proc_sample(pid))
+        failed = [t for t in tasks if t.done() and t.exception()]
+        if failed:
+            raise failed[0].exception()
+        report = step_report(n, clients, samples, since, args.interval)
+        report["saturated"] = saturated(report, args.interval)
+        reports.append(report)
+        print_report(report)
+        if report["saturated"] and not args.keep_going:
+            break
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return reports
+
+
+def print_report(r):
+    def ms(value):
+        return f"{value:7.1f}" if value is not None else "      -"
+    missed = f"{r['missed_ratio']:6.1%}" if r["missed_ratio"] is not None else "     -"
+    print(f"N={r['timers']:4d}  CPU {r['cpu_percent']:5.1f}%  RSS {r['rss_mb']:6.1f}MB  스레드 {r['threads']:3d}  "
+          f"틱 {r['ticks_per_second']:6.1f}/s  지연 p50 {ms(r['latency_p50_ms'])}ms p95 {ms(r['latency_p95_ms'])}ms  "
+          f"흔들림 p95 {ms(r['jitter_p95_ms'])}ms  놓침 {missed}  전환 {r['transitions']}"
+          + ("  <- 한계" if r["saturated"] else ""), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시에 도는 타이머 수에 따른 서버 CPU/메모리/스레드/틱 지연")
+    parser.add_argument("--steps", nargs="*", type=int, default=[1, 5, 10, 25, 50, 100], help="동시 타이머 수 (누적)")
+    parser.add_argument("--hold", type=float, default=20, help="단계마다 재는 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=3, help="클라이언트를 늘린 뒤 재기 전 대기 (초)")
+    parser.add_argument("--interval", type=float, default=1, help="서버 주기 확인 간격 POMODORO_CHECK_SECONDS (초)")
+    parser.add_argument("--focus", type=int, default=5, help="집중 시간 (초)")
+    parser.add_argument("--break", dest="brk", type=int, default=3, help="휴식 시간 (초)")
+    parser.add_argument("--keep-going", action="store_true", help="한계에 닿아도 남은 단계를 계속 잰다")
+    parser.add_argument("--out", default=None, help="결과 JSON 파일")
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp()
+    port = free_port()
+    server = start_server(folder, port, args.interval)
+    try:
+        print(f"서버 pid {server.pid}, 주기 확인 {args.interval}s, 집중 {args.focus}s / 휴식 {args.brk}s", flush=True)
+        reports = asyncio.run(ramp(f"ws://127.0.0.1:{port}/_stcore/stream", server.pid, args))
+    finally:
+        server.terminate()
+        try:
+            server.wait(10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+        shutil.rmtree(folder, ignore_errors=True)
+
+    limit = next((r["timers"] for r in reports if r["saturated"]), None)
+    if limit is None:
+        print(f"한계: N={reports[-1]['timers']} 까지 닿지 않음")
+    else:
+        print(f"한계: N={limit} (놓친 틱 > {SATURATION['missed']:.0%}, 지연 p95 > 주기의 "
+              f"{SATURATION['latency']:.0%}, CPU > {SATURATION['cpu']:.0f}% 중 하나)")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump({"interval": args.interval, "saturation_timers": limit, "steps": reports}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
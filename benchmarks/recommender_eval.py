@@ -0,0 +1,109 @@
+import argparse
+import collections
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import common  # noqa: F401  (저장소 루트를 import 경로에 넣는다)
+from pomodoro import sketch, storage
+from pomodoro.storage import synthetic
+from pomodoro.stats import RECOMMENDERS, WINDOW_DAYS, RollingStats
+
+# ===== 추천 방식 비교 =====
+# user_sessions.json 형식의 합성 기록(최근 14일)으로 추천 방식별 추천 집중시간을 비교한다.
+#   - 보통 세션: 평균 FOCUS 분, 표준편차 SPREAD 분 (이 분포의 평균 + 표준편차가 "정답")
+#   - 포기한 세션: 1~3분 (--short 비율)
+#   - 끄는 걸 잊은 세션: 2~5시간 (--long 비율)
+# 추천값은 실제 저장소/통계 경로(calculate_adjusted_focus)로 계산하고,
+# 스케치 오차는 같은 추정기를 원본 값 전체에 돌린 결과와 비교한다.
+#
+#   python benchmarks/recommender_eval.py --sessions 6 --short 0.1 --long 0.05
+FOCUS = 25
+SPREAD = 5
+
+
+# 오늘까지 14일, 쉬는 날 없이 (보통 / 포기 / 잊음 세션만)
+def synthetic_days(now, per_day, short, long, seed):
+    return list(synthetic.generate_days(WINDOW_DAYS, seed, end=now.date(), sessions=per_day, focus=FOCUS,
+                                        spread=SPREAD, zero=0, short=short, long=long, rest=0))
+
+
+def exact(method, durations):
+    pairs = sorted(collections.Counter(durations).items())
+    if method == "mean_std":
+        mean = sum(durations) / len(durations)
+        return mean + (sum((d - mean) ** 2 for d in durations) / len(durations)) ** 0.5
+    return sketch.ESTIMATORS[method](pairs)
+
+
+# 세션 하나 반영 비용 (날짜 칸 하나 + 스케치 구간 하나). 세션 수가 늘어도 같아야 한다
+def update_cost(counts, seed):
+    rng = random.Random(seed)
+    stats = RollingStats(os.devnull, "bench")
+    results = []
+    day = datetime(2024, 1, 1)
+    added = 0
+    for target in counts:
+        batch = [(day + timedelta(days=rng.randrange(WINDOW_DAYS))).strftime("%Y-%m-%d") for _ in range(target - added)]
+        minutes = [rng.randint(1, 600) for _ in batch]
+        started = time.perf_counter()
+        for date_str, m in zip(batch, minutes):
+            stats._add(date_str, m)
+        elapsed = time.perf_counter() - started
+        buckets = sum(len(slot[4]) for slot in stats.slots)
+        results.append((target, elapsed / max(1, len(batch)) * 1e6, buckets))
+        added = target
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추천 방식별 추천 집중시간 비교 (합성 기록)")
+    parser.add_argument("--sessions", type=float, default=6, help="하루 평균 세션 수")
+    parser.add_argument("--short", type=float, default=0.1, help="포기한 세션 비율")
+    parser.add_argument("--long", type=float, default=0.05, help="끄는 걸 잊은 세션 비율")
+    parser.add_argument("--seeds", type=int, default=20, help="반복 횟수 (시드 수)")
+    args = parser.parse_args()
+
+    now = datetime.now().replace(hour=23, minute=0, second=0, microsecond=0)
+    truth = FOCUS + SPREAD
+    scenarios = {
+        "극단값 없음": (0.0, 0.0),
+        f"포기 {args.short:.0%}": (args.short, 0.0),
+        f"잊음 {args.long:.0%}": (0.0, args.long),
+        "둘 다": (args.short, args.long),
+    }
+    print(f"정답(보통 세션의 평균 + 표준편차): {truth}분. 칸마다 정답과의 차이(시드 {args.seeds}개 평균), 괄호는 원본 값으로 계산한 것과의 최대 상대 오차")
+    print(f"{'':12}" + "".join(f"{m:>22}" for m in RECOMMENDERS))
+
+    with tempfile.TemporaryDirectory() as folder:
+        for name, (short, long) in scenarios.items():
+            errors = collections.defaultdict(list)
+            sketch_errors = collections.defaultdict(list)
+            for seed in range(args.seeds):
+                path = os.path.join(folder, f"{name}-{seed}", "user_sessions.json")
+                os.makedirs(os.path.dirname(path))
+                days = synthetic_days(now, args.sessions, short, long, seed)
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(days, f)
+                storage.DATA_PATH = path
+                durations = [s["duration_minutes"] for d in days for s in d["sessions"]]
+                for method in RECOMMENDERS:
+                    minutes = storage.calculate_adjusted_focus(now=now, method=method) / 60
+                    errors[method].append(abs(minutes - truth))
+                    sketch_errors[method].append(abs(minutes - exact(method, durations)) / exact(method, durations))
+            # mean_std 는 정수 합/제곱합으로 정확히 계산하므로 스케치 오차가 없다
+            print(f"{name:12}" + "".join(
+                f"{sum(errors[m]) / len(errors[m]):>10.1f}분 "
+                + ("(정확)" if m == "mean_std" else f"(스케치 {max(sketch_errors[m]):.1%})")
+                for m in RECOMMENDERS))
+
+    print("\n세션 하나 반영 비용 (세션 수가 늘어도 일정해야 함)")
+    for count, micros, buckets in update_cost([1_000, 10_000, 100_000, 1_000_000], 0):
+        print(f"  누적 {count:>9,}개: {micros:.2f}µs/세션, 스케치 구간 {buckets}개 (14일 합계)")
+
+
+if __name__ == "__main__":
+    main()
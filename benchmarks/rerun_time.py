@@ -0,0 +1,94 @@
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from common import ROOT
+
+# ===== 스크립트 한 번 실행(rerun) 시간 =====
+# 진입 스크립트를 AppTest 로 띄우고 타이머를 시작한 뒤 --runs 번 다시 실행하면서 한 번에 걸린 시간을 잰다.
+# --compare REV 를 주면 그 커밋의 트리도 같은 방법으로 재서 나란히 보여 준다.
+# 기록 파일은 임시 폴더에 쓰므로 저장소의 user_sessions.json 은 건드리지 않는다.
+#
+#   python benchmarks/rerun_time.py --runs 200 --compare HEAD~1
+SCRIPTS = {
+    "app.py": "▶️ 타이머 시작",
+    "최종디자인.py": "START",
+    "test.py": "▶️ 타이머 시작",
+    "feature-img_btn.py": None,
+}
+
+# 트리마다 새 파이썬 프로세스에서 잰다 (모듈 캐시가 섞이지 않도록)
+_CHILD = r"""
+import os, statistics, sys, time
+sys.path.insert(0, os.getcwd())
+from streamlit.testing.v1 import AppTest
+from pomodoro import storage
+storage.DATA_PATH = os.path.join(sys.argv[1], "user_sessions.json")
+script, start, runs = sys.argv[2], sys.argv[3], int(sys.argv[4])
+at = AppTest.from_file(script, default_timeout=60)
+at.run()
+if start:
+    next(b for b in at.button if b.label == start).click().run()
+for _ in range(5):
+    at.run()
+times = []
+for _ in range(runs):
+    t = time.perf_counter()
+    at.run()
+    times.append(time.perf_counter() - t)
+if at.exception:
+    raise SystemExit(at.exception[0].value)
+print(statistics.median(times) * 1000, min(times) * 1000)
+"""
+
+
+def measure(tree, script, runs):
+    start = SCRIPTS[script] or ""
+    with tempfile.TemporaryDirectory() as data:
+        out = subprocess.run([sys.executable, "-c", _CHILD, data, script, start, str(runs)],
+                             cwd=tree, capture_output=True, text=True)
+    if out.returncode:
+        raise RuntimeError(f"{script}: {out.stderr.strip().splitlines()[-1]}")
+    median, best = map(float, out.stdout.split())
+    return median, best
+
+
+def export_tree(rev, folder):
+    archive = subprocess.run(["git", "archive", rev], cwd=ROOT, capture_output=True, check=True).stdout
+    subprocess.run(["tar", "-x", "-C", folder], input=archive, check=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="진입 스크립트 rerun 한 번에 걸리는 시간")
+    parser.add_argument("--runs", type=int, default=100, help="스크립트별 측정 횟수")
+    parser.add_argument("--compare", metavar="REV", help="비교할 git 커밋 (예: HEAD~1)")
+    parser.add_argument("scripts", nargs="*", default=list(SCRIPTS))
+    args = parser.parse_args()
+
+    trees = [("현재", ROOT)]
+    folder = None
+    if args.compare:
+        folder = tempfile.mkdtemp()
+        export_tree(args.compare, folder)
+        trees.insert(0, (args.compare, folder))
+    try:
+        for script in args.scripts:
+            results = []
+            for name, tree in trees:
+                if not os.path.exists(os.path.join(tree, script)):
+                    continue
+                median, best = measure(tree, script, args.runs)
+                results.append(median)
+                print(f"{script} [{name}]: 중앙값 {median:.2f}ms, 최소 {best:.2f}ms")
+            if len(results) == 2:
+                print(f"{script}: {results[1] / results[0] * 100 - 100:+.1f}%")
+    finally:
+        if folder:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import argparse
+import json
+import os
+import re
+from html.parser import HTMLParser
+
+from common import ROOT
+
+INDEX = os.path.join(ROOT, "pomodoro", "frontend", "countdown", "index.html")
+
+# ===== 원형 타이머 매 초 바뀌는 양 =====
+# 예전에는 매 초 원형 전체 HTML(SVG, 그라데이션, 인라인 스타일)을 새로 만들어 넣었다.
+# 지금은 <template> 뼈대를 한 번만 그리고 매 초에는 data-bind 요소의 값만 바꾼다.
+# 컴포넌트 index.html 의 뼈대를 읽어서 한 번 실행(--seconds 초)에 두 방식이 넘기는 바이트와
+# 새로 만드는 요소 수를 비교한다.
+#
+#   python benchmarks/ring_payload.py --seconds 1500
+RING_CIRCUMFERENCE = 2 * 3.1416 * 129.6
+
+
+class _Counter(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.elements = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.elements += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.elements += 1
+
+
+def template(variant):
+    with open(INDEX, encoding="utf-8") as f:
+        html = f.read()
+    return re.search(rf'<template id="tpl-{variant}">(.*?)</template>', html, re.S).group(1).strip()
+
+
+def count_elements(markup):
+    counter = _Counter()
+    counter.feed(markup)
+    return counter.elements
+
+
+# 매 초 바뀌는 값 (index.html 의 update 와 같은 계산)
+def ring_values(remaining, total, phase):
+    hh, rem = divmod(remaining, 3600)
+    mm, ss = divmod(rem, 60)
+    pct = remaining / total if total > 0 else 0
+    is_break = phase == "break"
+    return {
+        "stroke-dashoffset": str(RING_CIRCUMFERENCE * (1 - pct)),
+        "stroke": "url(#grad_break)" if is_break else "url(#grad_focus)",
+        "color": "#1a661a" if is_break else "#003366",
+        "text": f"{hh:02d} : {mm:02d} : {ss:02d}",
+    }
+
+
+def conic_values(remaining, total, phase):
+    angle = (remaining / total if total > 0 else 0) * 360
+    mm, ss = divmod(remaining, 60)
+    return {
+        "background": f"conic-gradient(#e74c3c 0deg {angle}deg, #eeeeee {angle}deg 360deg)",
+        "text": f"{mm:02d}:{ss:02d}",
+    }
+
+
+VALUES = {"ring": ring_values, "conic": conic_values}
+
+
+def measure(variant, seconds, phase):
+    skeleton = template(variant)
+    full = changed = 0
+    previous = {}
+    for remaining in range(seconds, -1, -1):
+        values = VALUES[variant](remaining, seconds, phase)
+        # 예전: 뼈대 + 값 전체를 매번 새로 만든다
+        full += len(skeleton.encode()) + sum(len(v.encode()) for v in values.values())
+        # 지금: 이전 값과 다른 것만 쓴다
+        diff = {k: v for k, v in values.items() if previous.get(k) != v}
+        changed += len(json.dumps(diff, ensure_ascii=False).encode())
+        previous = values
+    ticks = seconds + 1
+    return full / ticks, changed / ticks, count_elements(skeleton)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="원형 타이머 매 초 바뀌는 바이트 비교")
+    parser.add_argument("--seconds", type=int, default=1500, help="단계 길이(초)")
+    parser.add_argument("--phase", default="focus", choices=["focus", "break"])
+    args = parser.parse_args()
+
+    for variant in VALUES:
+        full, changed, elements = measure(variant, args.seconds, args.phase)
+        print(f"{variant}: 예전 매 초 {full:.0f}바이트 + 요소 {elements}개 새로 생성 -> "
+              f"지금 매 초 {changed:.0f}바이트, 새 요소 0개 ({full / changed:.1f}배 적음)")
+
+
+if __name__ == "__main__":
+    main()
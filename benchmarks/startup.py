@@ -0,0 +1,76 @@
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import ROOT
+from pomodoro.storage import synthetic
+
+# ===== 첫 화면까지 걸리는 시간 (cold start) =====
+# 새 파이썬 프로세스에서 페이지를 AppTest 로 한 번 실행할 때까지의 시간과,
+# python -X importtime 으로 무거운 모듈(numpy, pandas, altair, pyarrow)을 가져오는 데 쓴 시간을 잰다.
+# 기록 페이지는 기록 없음 / 작은 기록 / 큰 기록 세 경우로 잰다.
+#
+#   python benchmarks/startup.py --small 30 --large 3000
+PAGES = ["app.py", "최종디자인.py", "pages/history.py"]
+HEAVY = ("numpy", "pandas", "altair", "pyarrow")
+
+_CHILD = r"""
+import os, sys, time
+start = time.perf_counter()
+sys.path.insert(0, os.getcwd())
+from streamlit.testing.v1 import AppTest
+from pomodoro import storage
+storage.DATA_PATH = sys.argv[1]
+at = AppTest.from_file(sys.argv[2], default_timeout=120)
+at.run()
+if at.exception:
+    raise SystemExit(at.exception[0].value)
+print(time.perf_counter() - start)
+"""
+
+
+def measure(page, data_path):
+    started = time.perf_counter()
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", _CHILD, data_path, page],
+                         cwd=ROOT, capture_output=True, text=True)
+    total = time.perf_counter() - started
+    if out.returncode:
+        raise RuntimeError(f"{page}: {out.stderr.strip().splitlines()[-1]}")
+    heavy = {}
+    for line in out.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)", line)
+        if match and match.group(3) in HEAVY:
+            heavy[match.group(3)] = heavy.get(match.group(3), 0) + int(match.group(1)) / 1e6
+    return total, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페이지 첫 실행까지 걸리는 시간과 무거운 import")
+    parser.add_argument("--small", type=int, default=30, help="작은 기록의 날짜 수")
+    parser.add_argument("--large", type=int, default=3000, help="큰 기록의 날짜 수")
+    parser.add_argument("pages", nargs="*", default=PAGES)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        cases = {"기록 없음": 0, f"{args.small}일": args.small, f"{args.large}일": args.large}
+        for page in args.pages:
+            for name, days in cases.items():
+                # 타이머 페이지는 기록 양과 상관없으므로 한 번만
+                if page != "pages/history.py" and days:
+                    continue
+                data_path = os.path.join(folder, f"{days}", "user_sessions.json")
+                os.makedirs(os.path.dirname(data_path), exist_ok=True)
+                if days:
+                    synthetic.write_history(data_path, days)
+                total, heavy = measure(page, data_path)
+                loaded = ", ".join(f"{m} {t:.2f}s" for m, t in heavy.items()) or "없음"
+                print(f"{page} [{name}]: 첫 실행까지 {total:.2f}s (무거운 import: {loaded})")
+
+
+if __name__ == "__main__":
+    main()
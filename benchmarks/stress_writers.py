@@ -0,0 +1,115 @@
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from multiprocessing import Process
+
+import common  # noqa: F401  (저장소 루트를 import 경로에 넣는다)
+from pomodoro import storage
+from pomodoro.storage.records import summarize_days
+
+# ===== 동시 저장 스트레스 테스트 =====
+# 프로세스 P 개 x 스레드 T 개가 같은 데이터 파일에 세션을 K 번씩 저장한 뒤
+#   - 세션이 하나도 빠지지 않았는지
+#   - 날짜별 session_number 가 1..n 으로 이어지는지
+#   - 날짜별 요약 / 14일 통계가 기록과 맞는지
+# 확인한다. 하나라도 어긋나면 종료 코드 1.
+# --crash N 을 주면 저장 도중 강제 종료(SIGKILL)되는 프로세스를 N 개 더 띄운다.
+# 이때는 죽은 프로세스가 남긴 세션 수를 알 수 없으므로 "적어도 expected 개"인지만 본다.
+#
+#   python benchmarks/stress_writers.py --mode log --processes 4 --threads 4 --sessions 50
+#   python benchmarks/stress_writers.py --mode json --crash 4
+
+
+def writer(path, mode, threads, sessions, seed):
+    storage.DATA_PATH = path
+    storage.STORAGE_MODE = mode
+
+    def run(t):
+        for i in range(sessions):
+            # 0분 세션도 섞어서 요약의 session_count / focus_count 를 함께 확인
+            storage.save_session_result((seed * 31 + t * 7 + i) % 50)
+            if i % 10 == 0:
+                storage.update_review(time.strftime("%Y-%m-%d"), f"p{seed} t{t} i{i}", i)
+
+    workers = [threading.Thread(target=run, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+
+def check(path, mode, expected, at_least=False):
+    storage.DATA_PATH = path
+    storage.STORAGE_MODE = mode
+    store = storage.get_store(path, mode)
+    store.compact()
+    days = store.load_days()
+    errors = []
+
+    total = sum(len(entry["sessions"]) for entry in days)
+    if total < expected or (total != expected and not at_least):
+        errors.append(f"세션 수 {total} != {expected}")
+    for entry in days:
+        numbers = [s["session_number"] for s in entry["sessions"]]
+        if numbers != list(range(1, len(numbers) + 1)):
+            errors.append(f"{entry['date']}: session_number 가 1..n 이 아님")
+
+    expected_summary = summarize_days(days)
+    for row in store.load_summary():
+        if row != expected_summary.get(row["date"]):
+            errors.append(f"{row['date']}: 요약 불일치 {row} != {expected_summary.get(row['date'])}")
+
+    # 새로 띄운 프로세스가 보는 14일 통계 (강제 종료로 어긋났으면 다시 만들어져야 한다)
+    counted = {d: (n, s) for d, n, s, *_ in storage.get_stats(store).slots if d is not None}
+    for row in store.load_summary():
+        if row["date"] in counted and counted[row["date"]] != (row["focus_count"], row["total_minutes"]):
+            errors.append(f"{row['date']}: 14일 통계 불일치 {counted[row['date']]}")
+    return total, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="여러 프로세스/스레드 동시 저장 확인")
+    parser.add_argument("--mode", choices=sorted(storage.STORES), default="json")
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--sessions", type=int, default=25)
+    parser.add_argument("--crash", type=int, default=0, help="도중에 강제 종료할 프로세스 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "user_sessions.json")
+        started = time.perf_counter()
+        procs = [
+            Process(target=writer, args=(path, args.mode, args.threads, args.sessions, p))
+            for p in range(args.processes)
+        ]
+        victims = [
+            Process(target=writer, args=(path, args.mode, args.threads, args.sessions * 100, 1000 + p))
+            for p in range(args.crash)
+        ]
+        for p in procs + victims:
+            p.start()
+        for i, p in enumerate(victims):
+            time.sleep(0.2 + 0.1 * i)
+            p.kill()
+        for p in procs + victims:
+            p.join()
+        elapsed = time.perf_counter() - started
+
+        failed = [p.exitcode for p in procs if p.exitcode != 0]
+        expected = args.processes * args.threads * args.sessions
+        total, errors = check(path, args.mode, expected, at_least=bool(victims))
+        if failed:
+            errors.append(f"저장 프로세스 비정상 종료: {failed}")
+
+    print(f"[{args.mode}] 세션 {total}/{expected} 저장, {elapsed:.2f}초")
+    for e in errors:
+        print("  실패:", e)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+
+import ring_payload
+import rerun_time
+from common import ROOT
+from pomodoro import storage
+from pomodoro.storage import synthetic
+
+# ===== 벤치마크 모음 (결과는 JSON) =====
+# 기록 크기와 실행 방식에 따른 숫자를 한 번에 재서 JSON 파일로 남긴다. 파일끼리 비교하면 변화를 볼 수 있다.
+#   rerun      진입 스크립트(app.py, 최종디자인.py) rerun 한 번 시간 (AppTest, 타이머 도는 중)
+#   tick       원형 타이머가 매 초 브라우저로 넘기는 바이트 (예전 draw_circle 방식 HTML 전체 vs 지금 바뀐 값만)
+#   save       save_session_result / update_review 한 번 시간 (저장 방식 x 기록 날짜 수)
+#   recommend  calculate_adjusted_focus 시간 (처음 = 통계 파일 만들기 포함, 이후 = 통계 파일만 읽기)
+#   history    pages/history.py 첫 화면과 rerun 시간 (AppTest)
+# 기록은 임시 폴더에 만들고 저장소의 user_sessions.json 은 건드리지 않는다.
+#
+#   python benchmarks/suite.py --days 10 1000 100000 --out benchmarks/results/today.json
+#   python benchmarks/suite.py --only save recommend --baseline benchmarks/results/old.json
+SECTIONS = ("rerun", "tick", "save", "recommend", "history")
+DAYS = [10, 1000, 100000]
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+# 측정마다 새 폴더에 기록 준비. sqlite 는 같은 기록을 db 로 옮긴다
+def prepare(folder, name, mode, days):
+    path = os.path.join(folder, f"{name}-{mode}-{days}", "user_sessions.json")
+    os.makedirs(os.path.dirname(path))
+    synthetic.write_history(path, days)
+    if mode == "sqlite":
+        storage.get_store(path, "sqlite").import_days(storage.get_store(path, "json").load_days())
+    return path
+
+
+def timed(func, reps):
+    times = []
+    for _ in range(reps):
+        started = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - started) * 1000)
+    return {"median_ms": statistics.median(times), "min_ms": min(times), "reps": reps}
+
+
+def bench_rerun(args):
+    results = {}
+    for script in ("app.py", "최종디자인.py"):
+        median, best = rerun_time.measure(ROOT, script, args.runs)
+        results[script] = {"median_ms": median, "min_ms": best, "reps": args.runs}
+    return results
+
+
+def bench_tick(args):
+    results = {}
+    for variant in ring_payload.VALUES:
+        full, changed, elements = ring_payload.measure(variant, 1500, "focus")
+        results[variant] = {"full_html_bytes": full, "changed_bytes": changed, "elements": elements}
+    return results
+
+
+def bench_save(args, folder):
+    results = {}
+    for mode in args.modes:
+        for days in args.days:
+            path = prepare(folder, "save", mode, days)
+            storage.DATA_PATH, storage.STORAGE_MODE = path, mode
+            storage.calculate_adjusted_focus()  # 통계/요약 파일 미리 만들기
+            # 100k 일 json 은 저장마다 파일 전체를 다시 쓰므로 횟수를 줄인다
+            reps = max(3, min(args.reps, 2_000_000 // max(days, 1) // 100))
+            today = datetime.now().strftime("%Y-%m-%d")
+            results[f"{mode}/{days}"] = {
+                "save_session_result": timed(lambda: storage.save_session_result(25), reps),
+                "update_review": timed(lambda: storage.update_review(today, "리뷰", 10), reps),
+                "file_bytes": sum(os.path.getsize(os.path.join(os.path.dirname(path), name))
+                                  for name in os.listdir(os.path.dirname(path))),
+            }
+    return results
+
+
+def bench_recommend(args, folder):
+    results = {}
+    for mode in args.modes:
+        for days in args.days:
+            path = prepare(folder, "recommend", mode, days)
+            storage.DATA_PATH, storage.STORAGE_MODE = path, mode
+            results[f"{mode}/{days}"] = {
+                "first": timed(storage.calculate_adjusted_focus, 1),
+                "warm": timed(storage.calculate_adjusted_focus, args.reps),
+            }
+    return results
+
+
+def bench_history(args, folder):
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    for days in args.days:
+        path = prepare(folder, "history", "json", days)
+        storage.DATA_PATH, storage.STORAGE_MODE = path, "json"
+        at = AppTest.from_file(os.path.join(ROOT, "pages", "history.py"), default_timeout=300)
+        first = timed(at.run, 1)
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+        results[str(days)] = {"first": first, "rerun": timed(at.run, min(args.reps, 20))}
+    return results
+
+
+def git_revision():
+    out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+    return out.stdout.strip() or None
+
+
+# 결과 dict 에서 "*_ms" / "*_bytes" 값만 (경로, 값) 으로 펼친다
+def flatten(results, prefix=""):
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten(value, name + ".")
+        elif key.endswith(("median_ms", "_bytes")):
+            yield name, value
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = dict(flatten(json.load(f)["results"]))
+    for name, value in flatten(results):
+        old = baseline.get(name)
+        if old:
+            print(f"  {name}: {old:.2f} -> {value:.2f} ({value / old * 100 - 100:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="틱/저장/기록 페이지 벤치마크 모음 (JSON 결과)")
+    parser.add_argument("--only", nargs="*", choices=SECTIONS, default=list(SECTIONS))
+    parser.add_argument("--days", nargs="*", type=int, default=DAYS, help="기록 날짜 수")
+    parser.add_argument("--modes", nargs="*", choices=sorted(storage.STORES), default=sorted(storage.STORES))
+    parser.add_argument("--runs", type=int, default=50, help="rerun 측정 횟수")
+    parser.add_argument("--reps", type=int, default=30, help="저장/추천 측정 횟수")
+    parser.add_argument("--out", default=None, help="결과 JSON (기본: benchmarks/results/<시각>-<커밋>.json)")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    revision = git_revision()
+    started = datetime.now()
+    results = {}
+    folder = tempfile.mkdtemp()
+    try:
+        for section in args.only:
+            t = time.perf_counter()
+            if section in ("rerun", "tick"):
+                results[section] = globals()[f"bench_{section}"](args)
+            else:
+                results[section] = globals()[f"bench_{section}"](args, folder)
+            print(f"{section}: {time.perf_counter() - t:.1f}s")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    out = args.out or os.path.join(RESULTS_DIR, f"{started:%Y%m%d-%H%M%S}-{revision or 'nogit'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    payload = {
+        "started": started.isoformat(timespec="seconds"),
+        "revision": revision,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    print(f"결과: {out}")
+    for name, value in flatten(results):
+        print(f"  {name}: {value:.2f}")
+    if args.baseline:
+        print(f"{args.baseline} 와 비교")
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
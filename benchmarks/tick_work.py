@@ -0,0 +1,99 @@
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from common import ROOT
+from rerun_time import export_tree
+
+# ===== 타이머 영역 한 번 실행에 드는 서버 작업 =====
+# 타이머가 도는 중에 컴포넌트 이벤트/주기 확인이 올 때 서버가 실행하는 코드의 시간과 위젯 수를 잰다.
+#   - fragment 가 없는 트리: 매번 스크립트 전체 (사이드바 입력, 버튼, 리뷰 폼 포함)
+#   - fragment 가 있는 트리: 타이머 영역(st.fragment 로 감싼 함수)만
+# AppTest 는 fragment 만 다시 실행하는 기능이 없어서, st.fragment 를 감싸 그 함수 본문 시간을 따로 잰다.
+#
+#   python benchmarks/tick_work.py --compare HEAD~1
+SCRIPTS = {
+    "app.py": "▶️ 타이머 시작",
+    "최종디자인.py": "START",
+}
+
+_CHILD = r"""
+import os, statistics, sys, time
+sys.path.insert(0, os.getcwd())
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+from pomodoro import storage
+storage.DATA_PATH = os.path.join(sys.argv[1], "user_sessions.json")
+script, start, runs = sys.argv[2], sys.argv[3], int(sys.argv[4])
+
+fragment_times = []
+fragment = st.fragment
+def timed_fragment(func=None, **kwargs):
+    def run(*args, **kw):
+        t = time.perf_counter()
+        try:
+            return func(*args, **kw)
+        finally:
+            fragment_times.append(time.perf_counter() - t)
+    return fragment(run, **kwargs)
+st.fragment = timed_fragment
+
+at = AppTest.from_file(script, default_timeout=60)
+at.run()
+next(b for b in at.button if b.label == start).click().run()
+for _ in range(5):
+    at.run()
+full = []
+fragment_times.clear()
+for _ in range(runs):
+    t = time.perf_counter()
+    at.run()
+    full.append(time.perf_counter() - t)
+if at.exception:
+    raise SystemExit(at.exception[0].value)
+widgets = len(at.number_input) + len(at.button) + len(at.text_area)
+print(statistics.median(full) * 1000, statistics.median(fragment_times) * 1000 if fragment_times else -1, widgets)
+"""
+
+
+def measure(tree, script, runs):
+    with tempfile.TemporaryDirectory() as data:
+        out = subprocess.run([sys.executable, "-c", _CHILD, data, script, SCRIPTS[script], str(runs)],
+                             cwd=tree, capture_output=True, text=True)
+    if out.returncode:
+        raise RuntimeError(f"{script}: {out.stderr.strip().splitlines()[-1]}")
+    full, fragment, widgets = out.stdout.split()
+    return float(full), float(fragment), int(widgets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="타이머 이벤트 한 번에 서버가 하는 작업 (fragment 전후)")
+    parser.add_argument("--runs", type=int, default=100, help="스크립트별 측정 횟수")
+    parser.add_argument("--compare", metavar="REV", help="비교할 git 커밋 (예: HEAD~1)")
+    parser.add_argument("scripts", nargs="*", default=list(SCRIPTS))
+    args = parser.parse_args()
+
+    trees = [("현재", ROOT)]
+    folder = None
+    if args.compare:
+        folder = tempfile.mkdtemp()
+        export_tree(args.compare, folder)
+        trees.insert(0, (args.compare, folder))
+    try:
+        for script in args.scripts:
+            for name, tree in trees:
+                full, fragment, widgets = measure(tree, script, args.runs)
+                if fragment < 0:
+                    print(f"{script} [{name}]: 이벤트마다 전체 실행 {full:.2f}ms (위젯 {widgets}개 다시 실행)")
+                else:
+                    print(f"{script} [{name}]: 이벤트마다 타이머 영역만 {fragment:.2f}ms "
+                          f"(전체 실행 {full:.2f}ms, 위젯 {widgets}개는 그대로)")
+    finally:
+        if folder:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+from streamlit.testing.v1 import AppTest
+
+from common import ROOT, use_root
+from pomodoro import clock, countdown, storage
+
+# ===== 타이머 오차 확인 =====
+# 실제 진입 스크립트를 AppTest 로 돌리면서 시간을 가짜 monotonic 시계로 바꾼다.
+#   - 스크립트 한 번 실행마다 --slow 초(+ 무작위 --jitter)가 흐른다 (느린 rerun)
+#   - 브라우저 카운트다운은 --latency 초 늦게 시작하고, 끝나면 phase_end 이벤트를 보낸다
+#   - 집중 25분 + 휴식 5분 x 2세션 = 1시간, 중간에 일시정지/재개를 한 번 넣는다
+# 타이머가 실제로 흐른 시간(일시정지 제외)과 1시간의 차이가 1초 미만이면 통과.
+#
+#   python benchmarks/timer_drift.py --slow 1.5 --latency 0.3
+SCRIPTS = {
+    "app.py": ("▶️ 타이머 시작", "⏸️ 일시정지"),
+    "최종디자인.py": ("START", "PAUSE"),
+    "test.py": ("▶️ 타이머 시작", "⏸️ 일시정지"),
+}
+FOCUS_MIN, BREAK_MIN, SESSIONS = 25, 5, 2
+
+
+class FakeTime:
+    def __init__(self):
+        self.t = 1000.0
+        self.resumes = []   # 시작/재개한 시각
+        self.pauses = []    # 일시정지한 시각
+
+    def now(self):
+        return self.t
+
+
+# 브라우저 카운트다운 대역: 새 실행(token/running 변화)을 받으면 latency 뒤부터 세기 시작한다
+class FakeBrowser:
+    def __init__(self, fake, slow, jitter, latency, rng):
+        self.fake = fake
+        self.slow = slow
+        self.jitter = jitter
+        self.latency = latency
+        self.rng = rng
+        self.key = None
+        self.deadline = None
+        self.fired = None
+        self.events = 0
+
+    def __call__(self, remaining, total, running, token, phase, **kwargs):
+        # 스크립트 실행 시간 (느린 rerun)
+        self.fake.t += self.slow + self.rng.uniform(0, self.jitter)
+        if (token, running) != self.key:
+            self.key = (token, running)
+            self.deadline = self.fake.t + self.latency + remaining if running else None
+        if running and self.fake.t >= self.deadline and self.fired != token:
+            self.fired = token
+            self.events += 1
+            return {"event": "phase_end", "phase": phase, "token": token, "id": f"{token}-{self.events}"}
+        return None
+
+
+def click(at, label):
+    next(b for b in at.button if b.label == label).click().run()
+
+
+def simulate(script, slow, jitter, latency, pause_at, pause_for, seed):
+    fake = FakeTime()
+    browser = FakeBrowser(fake, slow, jitter, latency, random.Random(seed))
+
+    # 사용자가 시작/일시정지/재개한 시각 기록 (단계 전환으로 다시 시작하는 것은 제외)
+    now, resume, pause = clock.now, clock.PhaseClock.resume, clock.PhaseClock.pause
+
+    def traced_resume(self, at=None):
+        if not self.running and len(fake.resumes) == len(fake.pauses):
+            fake.resumes.append(fake.t)
+        resume(self, at)
+
+    def traced_pause(self, at=None):
+        if self.running:
+            fake.pauses.append(fake.t)
+        pause(self, at)
+
+    clock.now, clock.PhaseClock.resume, clock.PhaseClock.pause = fake.now, traced_resume, traced_pause
+    countdown._component = browser
+    try:
+        at = AppTest.from_file(os.path.join(ROOT, script), default_timeout=60)
+        at.run()
+        inputs = at.number_input
+        for i, value in enumerate([0, FOCUS_MIN, 0, 0, BREAK_MIN, 0, SESSIONS]):
+            inputs[i].set_value(value)
+        at.run()
+
+        start_label, pause_label = SCRIPTS[script]
+        click(at, start_label)
+        started = fake.t
+        paused = False
+        while at.session_state["timer"].phase != "idle":
+            if not paused and fake.t - started >= pause_at:
+                click(at, pause_label)
+                fake.t += pause_for
+                click(at, start_label)
+                paused = True
+                continue
+            # 다음 브라우저 이벤트 시각까지 건너뛰고 (일시정지 예정 시각이 먼저면 거기까지) 다시 실행
+            target = browser.deadline
+            if not paused:
+                target = min(target, started + pause_at)
+            fake.t = max(fake.t, target)
+            # 모든 세션이 끝나면 시계가 비워지므로 마지막 단계 마감 시각을 미리 기억해 둔다
+            last_deadline = at.session_state["timer"].clock.deadline
+            at.run()
+            if at.exception:
+                raise RuntimeError(at.exception[0].value)
+
+        # 타이머가 돈 시간 = 처음 시작 ~ 마지막 단계 마감 시각 - 일시정지했던 시간
+        paused_total = sum(r - p for p, r in zip(fake.pauses, fake.resumes[1:]))
+        elapsed = last_deadline - fake.resumes[0] - paused_total
+        expected = SESSIONS * (FOCUS_MIN + BREAK_MIN) * 60
+        return elapsed - expected, fake.t - last_deadline, browser.events
+    finally:
+        clock.now, clock.PhaseClock.resume, clock.PhaseClock.pause = now, resume, pause
+
+
+def main():
+    parser = argparse.ArgumentParser(description="느린 rerun 에서 1시간 타이머 오차 확인")
+    parser.add_argument("--slow", type=float, default=1.5, help="스크립트 한 번 실행에 걸리는 시간(초)")
+    parser.add_argument("--jitter", type=float, default=0.5, help="실행 시간에 더할 무작위 지연 최대값(초)")
+    parser.add_argument("--latency", type=float, default=0.3, help="브라우저가 카운트다운을 받기까지 걸리는 시간(초)")
+    parser.add_argument("--pause-at", type=float, default=600, help="시작 후 일시정지할 시각(초)")
+    parser.add_argument("--pause-for", type=float, default=90, help="일시정지 시간(초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("scripts", nargs="*", default=list(SCRIPTS))
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as folder:
+        storage.DATA_PATH = os.path.join(folder, "user_sessions.json")
+        use_root()
+        for script in args.scripts:
+            drift, late, events = simulate(script, args.slow, args.jitter, args.latency,
+                                           args.pause_at, args.pause_for, args.seed)
+            ok = abs(drift) < 1.0
+            failed |= not ok
+            print(f"{script}: 오차 {drift:+.3f}초 (이벤트 {events}회, 마지막 알림 지연 {late:.2f}초) "
+                  f"{'통과' if ok else '실패'}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
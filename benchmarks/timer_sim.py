@@ -0,0 +1,49 @@
+import argparse
+import sys
+import time
+
+import common  # noqa: F401  (저장소 루트를 import 경로에 넣는다)
+from pomodoro.timer import ALL_DONE, FOCUS, IDLE, PomodoroTimer
+
+# ===== 타이머 시뮬레이션 =====
+# Streamlit 없이 PomodoroTimer 만으로 전체 세션을 돌린다 (시각은 at 으로 넘긴다).
+# 세션마다 집중 중간에 일시정지/재개를 한 번 넣고, 끝난 뒤 흐른 시간이 맞는지 확인한다.
+#
+#   python benchmarks/timer_sim.py --sessions 100000
+FOCUS_SECONDS, BREAK_SECONDS = 25 * 60, 5 * 60
+
+
+def run_once(goal):
+    timer = PomodoroTimer(FOCUS_SECONDS, BREAK_SECONDS, goal)
+    t = 0.0
+    timer.start(t)
+    paused = 0.0
+    while True:
+        if timer.phase == FOCUS:
+            timer.pause(t + 600)
+            timer.start(t + 690)
+            paused += 90
+        t = timer.clock.deadline
+        if timer.phase_end(t) == ALL_DONE:
+            break
+    if timer.phase != IDLE or t - paused != goal * (FOCUS_SECONDS + BREAK_SECONDS):
+        raise AssertionError(f"시간이 맞지 않음: {t - paused}")
+    return goal
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PomodoroTimer 전체 세션 시뮬레이션 속도")
+    parser.add_argument("--sessions", type=int, default=100000, help="시뮬레이션할 세션 수")
+    parser.add_argument("--goal", type=int, default=4, help="한 번에 돌릴 세션 목표")
+    args = parser.parse_args()
+
+    runs = max(1, args.sessions // args.goal)
+    started = time.perf_counter()
+    done = sum(run_once(args.goal) for _ in range(runs))
+    elapsed = time.perf_counter() - started
+    print(f"세션 {done}개 (집중+휴식, 일시정지 1회씩): {elapsed:.2f}초, 초당 {done / elapsed:,.0f}세션")
+    print(f"타이머 하나 크기: {sys.getsizeof(PomodoroTimer())}바이트 (__slots__, __dict__ 없음)")
+
+
+if __name__ == "__main__":
+    main()
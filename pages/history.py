@@ -1,94 +1,109 @@
+import math
 import streamlit as st
-import json
-import os
-import pandas as pd
-import altair as alt
+from pomodoro.history import RESOLUTIONS, date_axis, line_spec, load_history
+from pomodoro.metrics import run_finished, run_started
+from pomodoro.users import current_user
 
-# 기록 파일 경로
-DATA_PATH = "user_sessions.json"
+run_started()
 
-st.title("나의 뽀모도로 기록 보기")
+PAGE_SIZES = [7, 14, 30, 60]
 
-# 기록 데이터 불러오기
-def load_session_data():
-    if os.path.exists(DATA_PATH):
-        with open(DATA_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return []
+st.title("나의 뽀모도로 기록 보기")
 
-data = load_session_data()
+# 기록 데이터 불러오기 (기록이 없으면 아무것도 읽지 않고, 작은 기록은 pandas 없이 리스트로)
+history = load_history(current_user())
 
-if not data:
+if history is None:
     st.info("아직 저장된 기록이 없습니다.")
 else:
-    # 날짜 기준 내림차순 정렬
-    data_sorted = sorted(data, key=lambda x: x["date"], reverse=True)
+    # ===== 기간 / 페이지 선택 =====
+    first_day, last_day = history.bounds()
+
+    col_range, col_size = st.columns([3, 1])
+    with col_range:
+        picked = st.date_input("기간", value=(first_day, last_day), min_value=first_day, max_value=last_day)
+    with col_size:
+        page_size = st.selectbox("페이지당 날짜 수", PAGE_SIZES, index=1)
+
+    # 시작일만 고른 상태면 그날부터 끝까지
+    start = picked[0] if picked else first_day
+    end = picked[1] if len(picked) > 1 else last_day
+    start_str, end_str = start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+
+    page_count = max(1, math.ceil(history.count(start_str, end_str) / page_size))
+    # 기간이나 페이지 크기가 바뀌면 1페이지부터 다시
+    page = st.number_input(f"페이지 (총 {page_count})", 1, page_count, 1,
+                           key=f"page_{start_str}_{end_str}_{page_size}") if page_count > 1 else 1
+
+    # 날짜 기준 내림차순, 현재 페이지만
+    page_days = history.page(start_str, end_str, page, page_size)
 
     st.subheader("기록 목록")
 
-    total_summary = []
+    if not page_days:
+        st.markdown("선택한 기간에 기록이 없습니다.")
 
-    for entry in data_sorted:
+    for entry in page_days:
         with st.expander(f"{entry['date']} 기록", expanded=False):
-            sessions = entry.get("sessions", [])
-
-            if sessions:
-                for s in sessions:
-                    st.markdown(f"- 세션 {s['session_number']} : **{s['duration_minutes']}분**")
+            if entry["sessions"]:
+                for number, minutes in entry["sessions"]:
+                    st.markdown(f"- 세션 {number} : **{minutes}분**")
             else:
                 st.markdown("세션 기록 없음")
 
-            review = entry.get("daily_review", "")
+            review = entry["daily_review"]
             if review:
                 st.markdown(f"**리뷰**: {review}")
             else:
                 st.markdown("리뷰 없음")
 
-            additional = entry.get("addition_time", None)
+            additional = entry["addition_time"]
             if additional is not None:
                 st.markdown(f"**추가 집중 가능 시간**: {additional}분")
             else:
                 st.markdown("추가 집중 시간 미입력")
 
-            # 세션별 그래프
-            if sessions:
-                df = pd.DataFrame(sessions)
-                df = df.sort_values("session_number")
-
-                line_chart = alt.Chart(df).mark_line(point=True).encode(
-                    x=alt.X("session_number:O", title="세션 번호", axis=alt.Axis(labelAngle=0)),
-                    y=alt.Y("duration_minutes", title="집중 시간 (분)"),
-                    tooltip=["session_number", "duration_minutes"]
-                ).properties(
-                    width=500,
-                    height=300,
-                    title="세션별 집중 시간 추이"
-                )
-                st.altair_chart(line_chart, use_container_width=True)
-
-            total_focus_time = sum(s["duration_minutes"] for s in sessions)
-            total_summary.append({"date": entry["date"], "total_focus": total_focus_time})
-
-    # 날짜별 전체 그래프
-    if total_summary:
-        st.subheader("")
-
-        summary_df = pd.DataFrame(total_summary)
-        summary_df = summary_df.sort_values("date")
-        summary_df["formatted_date"] = pd.to_datetime(summary_df["date"]).dt.strftime("%m/%d")
-
-        total_chart = alt.Chart(summary_df).mark_line(point=True).encode(
-            x=alt.X("formatted_date", title="날짜", axis=alt.Axis(labelAngle=0)),
-            y=alt.Y("total_focus", title="총 집중 시간 (분)"),
-            tooltip=["formatted_date", "total_focus"]
-        ).properties(
-            width=700,
-            height=350,
-            title="전체 날짜별 집중 시간 변화"
+    # 세션별 그래프 (고른 날짜 하나만 만든다)
+    sessions_by_date = {entry["date"]: entry["sessions"] for entry in page_days if entry["sessions"]}
+    if sessions_by_date:
+        chart_date = st.selectbox("세션별 그래프로 볼 날짜", list(sessions_by_date))
+        values = [{"session_number": number, "duration_minutes": minutes}
+                  for number, minutes in sorted(sessions_by_date[chart_date])]
+
+        line_chart = line_spec(
+            values,
+            x={"field": "session_number", "type": "ordinal", "title": "세션 번호", "axis": {"labelAngle": 0}},
+            y={"field": "duration_minutes", "type": "quantitative", "title": "집중 시간 (분)"},
+            title=f"{chart_date} 세션별 집중 시간 추이",
         )
-
-        st.altair_chart(total_chart, use_container_width=True)
-
-
-
-
+        st.vega_lite_chart(spec=line_chart, use_container_width=True)
+
+    # 날짜별 요약 (저장할 때 함께 갱신된 값) - 추이 그래프와 내보내기에 사용
+    st.download_button(
+        "날짜별 요약 CSV 내려받기",
+        history.summary_csv(start_str, end_str),
+        file_name=f"pomodoro_summary_{start_str}_{end_str}.csv",
+        mime="text/csv",
+    )
+
+    # 날짜별 전체 그래프 (기간에 따라 일/주/월 단위로 묶고, 점 개수는 TREND_POINTS 이하)
+    st.subheader("")
+
+    resolution_labels = {"auto": "자동"} | {key: label for key, (label, _) in RESOLUTIONS.items()}
+    resolution = st.radio("해상도", list(resolution_labels), format_func=resolution_labels.get, horizontal=True)
+
+    trend, resolution = history.trend(start_str, end_str, resolution)
+    date_format = "%Y/%m" if resolution == "monthly" else "%m/%d"
+    if start.year != end.year and resolution != "monthly":
+        date_format = "%Y/%m/%d"
+
+    total_chart = line_spec(
+        trend,
+        x=date_axis("date", "날짜", date_format),
+        y={"field": "total_focus", "type": "quantitative", "title": f"{RESOLUTIONS[resolution][0]} 총 집중 시간 (분)"},
+        title="전체 날짜별 집중 시간 변화",
+        height=350,
+    )
+    st.vega_lite_chart(spec=total_chart, use_container_width=True)
+
+run_finished("pages/history.py")
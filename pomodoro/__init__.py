@@ -0,0 +1 @@
+# 뽀모도로 타이머 공용 모듈
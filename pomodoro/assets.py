@@ -0,0 +1,100 @@
+import base64
+import os
+import re
+import threading
+
+import streamlit.components.v1 as components
+
+# ===== 📦 정적 파일 (CSS, 버튼 이미지) =====
+# 파일을 읽고 줄이고(CSS) 인코딩하는 일은 프로세스당 한 번만 한다. 이후 rerun 은 메모리에서 꺼내 쓴다.
+# POMODORO_DEV=1 이면 쓸 때마다 mtime 을 확인해서 파일이 바뀌었으면 다시 읽는다 (개발 중 CSS 수정 반영).
+#
+# btn_img/ 는 Streamlit 컴포넌트 경로로 등록해서 /component/pomodoro.assets.btn_img/<파일> 로 내보낸다.
+# 이 주소는 Cache-Control: public 으로 나가므로 브라우저가 캐시하고, rerun 마다 base64 를 다시 보내지 않는다.
+# 컴포넌트 iframe 안에서는 상대 주소(../pomodoro.assets.btn_img/start.png)로 쓴다.
+DEV = os.environ.get("POMODORO_DEV", "") not in ("", "0")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BTN_IMG_DIR = os.path.join(ROOT, "btn_img")
+_BTN_IMG_COMPONENT = "btn_img"
+components.declare_component(_BTN_IMG_COMPONENT, path=BTN_IMG_DIR)
+
+_cache = {}
+_lock = threading.Lock()
+
+
+# (종류, 절대 경로) -> build(파일 내용) 결과. 개발 모드가 아니면 처음 한 번만 디스크를 읽는다
+def _load(kind, path, build, binary=False):
+    path = os.path.abspath(path)
+    key = (kind, path)
+    entry = _cache.get(key)
+    if entry is not None and not DEV:
+        return entry[1]
+
+    mtime = os.stat(path).st_mtime_ns
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+    with open(path, "rb" if binary else "r", **({} if binary else {"encoding": "utf-8"})) as f:
+        value = build(f.read())
+    with _lock:
+        _cache[key] = (mtime, value)
+    return value
+
+
+# ===== 🎨 CSS =====
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_SPACE = re.compile(r"\s+")
+_AROUND = re.compile(r"\s*([{};,>])\s*")
+_BLOCK = re.compile(r"\{[^{}]*\}")
+_COLON = re.compile(r"\s*:\s*")
+
+
+# 주석/공백을 줄인다 (선택자 안의 띄어쓰기는 하나로 남긴다)
+def minify_css(css):
+    css = _COMMENT.sub("", css)
+    css = _SPACE.sub(" ", css)
+    css = _AROUND.sub(r"\1", css)
+    # 선언 블록 안의 "속성 : 값" 만 붙인다 (선택자의 "a :hover" 는 그대로)
+    css = _BLOCK.sub(lambda m: _COLON.sub(":", m.group(0)), css)
+    return css.replace(";}", "}").strip()
+
+
+# 파일 -> "<style>줄인 CSS</style>"
+def css_block(path):
+    return _load("css", path, lambda text: f"<style>{minify_css(text)}</style>")
+
+
+# 코드 안의 CSS 문자열 ("<style>...</style>" 포함 가능) 을 한 번만 줄인다
+def minified_block(css):
+    entry = _cache.get(("inline", css))
+    if entry is None:
+        body = css.strip()
+        if body.startswith("<style>") and body.endswith("</style>"):
+            body = body[len("<style>"):-len("</style>")]
+        entry = (None, f"<style>{minify_css(body)}</style>")
+        with _lock:
+            _cache[("inline", css)] = entry
+    return entry[1]
+
+
+# ===== 🖼 이미지 =====
+def image_base64(path):
+    return _load("base64", path, lambda data: base64.b64encode(data).decode(), binary=True)
+
+
+# 컴포넌트 iframe 에서 쓸 이미지 주소. btn_img/ 안이면 캐시되는 정적 주소, 아니면 data URI
+def image_url(path):
+    path = os.path.abspath(path)
+    if os.path.dirname(path) == BTN_IMG_DIR:
+        version = _version(path)
+        return f"../{__name__}.{_BTN_IMG_COMPONENT}/{os.path.basename(path)}?v={version}"
+    return f"data:image/png;base64,{image_base64(path)}"
+
+
+# 파일이 바뀌면 브라우저가 새로 받도록 주소에 mtime 을 붙인다 (개발 모드가 아니면 처음 한 번만 확인)
+def _version(path):
+    key = ("version", path)
+    if DEV or key not in _cache:
+        with _lock:
+            _cache[key] = (None, os.stat(path).st_mtime_ns)
+    return _cache[key][1]
@@ -0,0 +1,56 @@
+import time
+
+# ===== ⏱ 단계 시계 =====
+# 남은 시간을 1초씩 빼지 않고 time.monotonic() 기준 마감 시각에서 매번 계산한다.
+# 스크립트 실행이 늦어지거나 벽시계가 바뀌어도 오차가 쌓이지 않는다.
+#   - 진행 중: deadline (monotonic 마감 시각)
+#   - 멈춤   : paused_elapsed (이번 단계에서 이미 흐른 초, 소수점까지)
+# 다음 단계는 이벤트를 처리한 시각이 아니라 이전 단계의 마감 시각에서 시작한다.
+# 모든 메서드의 at 은 테스트용 (기본값은 지금 시각)
+
+
+def now():
+    return time.monotonic()
+
+
+class PhaseClock:
+    __slots__ = ("duration", "paused_elapsed", "deadline")
+
+    def __init__(self, duration=0):
+        self.duration = duration
+        self.paused_elapsed = 0.0
+        self.deadline = None
+
+    @property
+    def running(self):
+        return self.deadline is not None
+
+    # 새 단계 (멈춘 상태로 duration 초를 맞춰 둔다)
+    def set(self, duration):
+        self.duration = duration
+        self.paused_elapsed = 0.0
+        self.deadline = None
+
+    def resume(self, at=None):
+        if self.running:
+            return
+        start = now() if at is None else at
+        self.deadline = start + self.duration - self.paused_elapsed
+
+    def pause(self, at=None):
+        if not self.running:
+            return
+        self.paused_elapsed = self.duration - self.remaining(at)
+        self.deadline = None
+
+    # 남은 초 (소수점까지)
+    def remaining(self, at=None):
+        if not self.running:
+            return max(0.0, self.duration - self.paused_elapsed)
+        return max(0.0, self.deadline - (now() if at is None else at))
+
+    # 이전 단계 마감 시각에 이어서 다음 단계 시작
+    def next_phase(self, duration, at=None):
+        start = self.deadline if self.running else (now() if at is None else at)
+        self.set(duration)
+        self.resume(start)
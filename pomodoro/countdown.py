@@ -0,0 +1,52 @@
+import os
+import time
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from . import metrics
+
+# ===== ⏱ 브라우저 카운트다운 컴포넌트 =====
+# 1초마다 스크립트를 다시 돌리지 않고 브라우저가 직접 초를 센다.
+# 파이썬 쪽으로는 단계가 끝났을 때(집중→휴식, 휴식→다음 세션/종료)만 이벤트가 돌아온다.
+# controls 를 주면 컴포넌트 안에 시작/일시정지/초기화/중지 버튼을 그리고, 누르면 control 이벤트가 돌아온다.
+# iframe 은 페이지에 한 번만 만들어지고 rerun 때는 바뀐 값만 받는다.
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "countdown")
+_component = components.declare_component("countdown", path=_FRONTEND_DIR)
+
+
+# 카운트다운 표시. 처리할 새 이벤트가 있으면 dict, 없으면 None
+#   {"event": "phase_end", "phase", "token", "id"} / {"event": "control", "action": "start" 등, "id"}
+# remaining 은 소수점까지 넘기고 화면에는 올림한 초를 보여 준다
+# controls: [{"action": "start", "label": "▶️", "img": 이미지 주소(선택)}, ...] (height 에 버튼 줄 높이를 더해서 준다)
+def countdown(remaining, total, running, token, phase="idle", variant="conic", height=260, key="countdown",
+              controls=None):
+    args = dict(
+        remaining=round(float(remaining), 3),
+        total=int(total),
+        running=bool(running),
+        token=token,
+        phase=phase,
+        variant=variant,
+        height=height,
+        # 리스트를 넘기면 Streamlit 이 DataFrame 인지 확인하느라 numpy/pandas/pyarrow 를 가져온다 (~0.8초).
+        # 튜플은 그 확인을 건너뛰고 JSON 으로는 똑같이 배열로 간다.
+        controls=tuple(controls or ()),
+    )
+    started = time.perf_counter()
+    event = _component(**args, key=key, default=None)
+    metrics.countdown_rendered(time.perf_counter() - started, args)
+
+    # 컴포넌트 값은 다음 rerun에도 그대로 남아 있으므로 한 번만 처리한다
+    seen_key = f"_{key}_seen_event"
+    if not event or st.session_state.get(seen_key) == event["id"]:
+        return None
+    st.session_state[seen_key] = event["id"]
+
+    if event["event"] == "control":
+        return event
+
+    # 이미 지나간 실행(일시정지/초기화 이전)의 이벤트는 무시
+    if not running or event["token"] != token:
+        return None
+    return event
@@ -0,0 +1,323 @@
+import bisect
+import csv
+import functools
+import io
+import math
+from datetime import date, timedelta
+
+import streamlit as st
+
+from . import storage
+from .storage.records import new_summary
+
+# ===== 📚 기록 페이지용 데이터 =====
+# numpy / pandas 는 가져오는 데만 0.5초 넘게 걸리므로 큰 기록(SMALL_DAYS 일 초과)일 때만 import 한다.
+#   - 기록 없음     : None (무거운 import 없음)
+#   - 작은 기록     : RowHistory   저장소가 주는 리스트를 그대로 쓰는 순수 파이썬
+#   - 큰 기록       : FrameHistory 날짜별 기록을 한 번에 훑어서 만든 열 단위 DataFrame
+# 두 클래스는 같은 메서드를 제공하고, 페이지에는 리스트/dict 만 돌려준다.
+#   bounds()                        (첫 날짜, 마지막 날짜) datetime.date
+#   count(start, end)               범위 안의 날짜 수
+#   page(start, end, page, size)    날짜 내림차순 한 페이지
+#                                   [{"date", "daily_review", "addition_time", "sessions": [(번호, 분), ...]}]
+#   summary_csv(start, end)         범위 안의 날짜별 요약 CSV (records.new_summary 열)
+#   trend(start, end, resolution)   ([{"date", "total_focus"}], 실제 해상도)
+# start/end 는 "YYYY-MM-DD" 문자열이고 양 끝을 포함한다.
+
+# 그래프에 보내는 점 개수는 기간과 상관없이 TREND_POINTS 를 넘지 않는다.
+TREND_POINTS = 120
+# 이 날짜 수까지는 일별로 그려도 TREND_POINTS 이하라서 다운샘플링(numpy)이 필요 없다
+SMALL_DAYS = TREND_POINTS
+RESOLUTIONS = {
+    "daily": ("일별", None),
+    "weekly": ("주별", "W-MON"),
+    "monthly": ("월별", "MS"),
+}
+
+
+def load_history(user=None):
+    if not storage.has_data(user):
+        return None
+    store = storage.flush(storage.get_store(user=user))
+    key = (store.path, storage.STORAGE_MODE, store.signature())
+    days = _day_count(*key)
+    if days == 0:
+        return None
+    if days <= SMALL_DAYS:
+        return RowHistory(*_load_rows(*key))
+    return FrameHistory(*_load_frames(*key))
+
+
+# 데이터 파일의 (mtime, 크기)가 그대로면 다시 읽지 않는다
+@functools.lru_cache(maxsize=32)
+def _day_count(path, mode, signature):
+    return len(storage.get_store(path, mode).load_summary())
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _load_rows(path, mode, signature):
+    store = storage.get_store(path, mode)
+    return store.load_days(newest_first=True), store.load_summary()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _load_frames(path, mode, signature):
+    store = storage.get_store(path, mode)
+    days_df, sessions_df = flatten_days(store.load_days(newest_first=True))
+    return days_df, sessions_df, summary_frame(store.load_summary())
+
+
+def to_date(date_str):
+    return date.fromisoformat(date_str)
+
+
+# 자동 해상도: 석 달까지는 일별, 2년까지는 주별, 그 이상은 월별
+def auto_resolution(start, end):
+    span = (to_date(str(end)[:10]) - to_date(str(start)[:10])).days + 1
+    if span <= 92:
+        return "daily"
+    if span <= 2 * 366:
+        return "weekly"
+    return "monthly"
+
+
+def _page_entry(entry, sessions):
+    return {
+        "date": entry["date"],
+        "daily_review": entry.get("daily_review", ""),
+        "addition_time": entry.get("addition_time", None),
+        "sessions": sessions,
+    }
+
+
+def _summary_csv(rows):
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(new_summary("")), lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+    return out.getvalue()
+
+
+# ===== 🪶 작은 기록: 순수 파이썬 =====
+class RowHistory:
+    def __init__(self, days, summary):
+        self.days = days                                   # 날짜 내림차순
+        self.dates = [entry["date"] for entry in reversed(days)]  # 날짜 오름차순 (bisect 용)
+        self.rows = summary                                # 날짜 오름차순
+        self.summary_dates = [row["date"] for row in summary]
+
+    def bounds(self):
+        return to_date(self.dates[0]), to_date(self.dates[-1])
+
+    def _range(self, dates, start, end):
+        return bisect.bisect_left(dates, start), bisect.bisect_right(dates, end)
+
+    def count(self, start, end):
+        lo, hi = self._range(self.dates, start, end)
+        return hi - lo
+
+    def page(self, start, end, page, size):
+        lo, hi = self._range(self.dates, start, end)
+        n = len(self.days)
+        first = n - hi + (page - 1) * size
+        entries = self.days[first:min(n - lo, first + size)]
+        return [
+            _page_entry(entry, [(s["session_number"], s["duration_minutes"]) for s in entry.get("sessions", [])])
+            for entry in entries
+        ]
+
+    def summary(self, start, end):
+        lo, hi = self._range(self.summary_dates, start, end)
+        return self.rows[lo:hi]
+
+    def summary_csv(self, start, end):
+        return _summary_csv(self.summary(start, end))
+
+    # 일별은 기록이 있는 날짜만, 주별(월요일 시작)/월별(1일 시작)은 빈 기간도 0 으로 채운다 (FrameHistory 와 같음)
+    def trend(self, start, end, resolution="auto"):
+        rows = self.summary(start, end)
+        if resolution == "auto":
+            resolution = auto_resolution(rows[0]["date"], rows[-1]["date"]) if rows else "daily"
+        if resolution == "daily" or not rows:
+            return [{"date": row["date"], "total_focus": row["total_minutes"]} for row in rows], resolution
+
+        bucket = _week_start if resolution == "weekly" else _month_start
+        totals = {}
+        for row in rows:
+            key = bucket(to_date(row["date"]))
+            totals[key] = totals.get(key, 0) + row["total_minutes"]
+        points = []
+        current, last = min(totals), max(totals)
+        while current <= last:
+            points.append({"date": current.isoformat(), "total_focus": totals.get(current, 0)})
+            current = _next_bucket(current, resolution)
+        return points, resolution
+
+
+def _week_start(day):
+    return day - timedelta(days=day.weekday())
+
+
+def _month_start(day):
+    return day.replace(day=1)
+
+
+def _next_bucket(day, resolution):
+    if resolution == "weekly":
+        return day + timedelta(days=7)
+    return (day.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+# ===== 🐼 큰 기록: DataFrame =====
+#   days      : date, daily_review, addition_time          (날짜 내림차순)
+#   sessions  : date, session_number, duration_minutes
+#   summary   : 저장소의 날짜별 요약 (records.new_summary 열, 날짜 오름차순)
+def flatten_days(days):
+    import pandas as pd
+
+    day_dates, reviews, additions = [], [], []
+    dates, numbers, minutes = [], [], []
+    for entry in days:
+        day_dates.append(entry["date"])
+        reviews.append(entry.get("daily_review", ""))
+        additions.append(entry.get("addition_time", None))
+        for s in entry.get("sessions", []):
+            dates.append(entry["date"])
+            numbers.append(s["session_number"])
+            minutes.append(s["duration_minutes"])
+
+    days_df = pd.DataFrame({
+        "date": day_dates,
+        "daily_review": reviews,
+        "addition_time": pd.Series(additions, dtype=object),  # None 을 NaN 으로 바꾸지 않도록
+    })
+    sessions_df = pd.DataFrame({"date": dates, "session_number": numbers, "duration_minutes": minutes})
+    return days_df, sessions_df
+
+
+# 일별 합계는 세션을 다시 더하지 않고 저장소의 날짜별 요약에서 가져온다
+def summary_frame(rows):
+    import pandas as pd
+
+    frame = pd.DataFrame(rows, columns=list(new_summary("")))
+    # None 이 섞인 정수 열을 float 으로 바꾸지 않도록 (CSV 에 112.0 이 아니라 112)
+    frame["addition_time"] = pd.Series([row["addition_time"] for row in rows], dtype=object)
+    return frame
+
+
+class FrameHistory:
+    def __init__(self, days_df, sessions_df, daily_df):
+        self.days_df = days_df
+        self.sessions_df = sessions_df
+        self.daily_df = daily_df
+
+    def bounds(self):
+        return to_date(self.days_df["date"].min()), to_date(self.days_df["date"].max())
+
+    def _range_days(self, start, end):
+        return self.days_df[(self.days_df["date"] >= start) & (self.days_df["date"] <= end)]
+
+    def count(self, start, end):
+        return len(self._range_days(start, end))
+
+    def page(self, start, end, page, size):
+        page_days = self._range_days(start, end).iloc[(page - 1) * size: page * size]
+        page_sessions = self.sessions_df[self.sessions_df["date"].isin(page_days["date"])]
+        sessions_by_date = {
+            d: list(zip(group["session_number"].tolist(), group["duration_minutes"].tolist()))
+            for d, group in page_sessions.groupby("date")
+        }
+        return [
+            _page_entry(entry, sessions_by_date.get(entry["date"], []))
+            for entry in page_days.to_dict("records")
+        ]
+
+    def summary(self, start, end):
+        return self.daily_df[(self.daily_df["date"] >= start) & (self.daily_df["date"] <= end)]
+
+    def summary_csv(self, start, end):
+        return self.summary(start, end).to_csv(index=False)
+
+    def trend(self, start, end, resolution="auto"):
+        trend, resolution = trend_series(self.summary(start, end), resolution)
+        points = [{"date": d.strftime("%Y-%m-%d"), "total_focus": total}
+                  for d, total in zip(trend["date"], trend["total_focus"].tolist())]
+        return points, resolution
+
+
+# ===== 📈 전체 추이 그래프 (FrameHistory) =====
+# Largest-Triangle-Three-Buckets: 모양을 유지하면서 threshold 개의 점만 남긴다 (남길 위치 반환)
+def lttb(x, y, threshold):
+    import numpy as np
+
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (threshold - 2)
+    picked = [0]
+    a = 0
+    for i in range(threshold - 2):
+        avg_start = int(math.floor((i + 1) * every)) + 1
+        avg_end = min(int(math.floor((i + 2) * every)) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        range_start = int(math.floor(i * every)) + 1
+        range_end = int(math.floor((i + 1) * every)) + 1
+        areas = np.abs(
+            (x[a] - avg_x) * (y[range_start:range_end] - y[a])
+            - (x[a] - x[range_start:range_end]) * (avg_y - y[a])
+        )
+        a = range_start + int(np.argmax(areas))
+        picked.append(a)
+    picked.append(n - 1)
+    return np.array(picked)
+
+
+# 날짜별 요약(date, total_minutes) -> 그래프용 (date, total_focus), 실제 사용한 해상도
+def trend_series(summary_df, resolution="auto", budget=TREND_POINTS):
+    import numpy as np
+    import pandas as pd
+
+    if resolution == "auto":
+        resolution = auto_resolution(summary_df["date"].min(), summary_df["date"].max()) if len(summary_df) else "daily"
+
+    series = pd.Series(summary_df["total_minutes"].to_numpy(), index=pd.to_datetime(summary_df["date"]))
+    rule = RESOLUTIONS[resolution][1]
+    if rule is not None:
+        # 주별은 월요일 시작, 월별은 1일 시작으로 묶고 시작일을 라벨로 쓴다
+        series = series.resample(rule, closed="left", label="left").sum()
+
+    if len(series) > budget:
+        x = series.index.to_numpy(dtype="datetime64[D]").astype(np.int64).astype(float)
+        series = series.iloc[lttb(x, series.to_numpy(dtype=float), budget)]
+
+    trend = series.rename("total_focus").rename_axis("date").reset_index()
+    return trend, resolution
+
+
+# ===== 📊 그래프 스펙 =====
+# altair 대신 vega-lite 스펙을 직접 만든다 (altair import 0.5초 절약).
+# 데이터는 최상위 "data" 가 아니라 layer 안에 넣는다. 최상위에 두면 Streamlit 이 Arrow 로 바꾸느라 pandas 를 가져온다.
+# 점 개수는 TREND_POINTS 이하라서 스펙 JSON 에 그대로 실어도 작다.
+def line_spec(values, x, y, title, height=300):
+    return {
+        "title": title,
+        "height": height,
+        "layer": [{
+            "data": {"values": values},
+            "mark": {"type": "line", "point": True},
+            "encoding": {"x": x, "y": y, "tooltip": [x, y]},
+        }],
+    }
+
+
+# 날짜 문자열(YYYY-MM-DD)은 UTC 자정으로 해석되므로 축/툴팁도 UTC 로 표시한다
+def date_axis(field, title, date_format):
+    return {
+        "field": field, "type": "temporal", "title": title,
+        "scale": {"type": "utc"},
+        "format": date_format, "formatType": "utc",
+        "axis": {"labelAngle": 0, "format": date_format, "formatType": "utc"},
+    }
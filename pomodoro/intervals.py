@@ -0,0 +1,194 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+
+from . import storage
+from .storage.locking import atomic_write, locked
+
+# ===== 🔁 세션 결과에 따른 시간 자동 조정 (test.py) =====
+# 성공률이 2/3 이상이면 집중 +1분 / 휴식 -1분, 아니면 집중 -1분 / 휴식 +1분.
+# 성공률은 최근 3세션에 지금 요일/시간대의 지난 성공률을 더해서 구한다 (OutcomeModel.success_rate).
+# 집중은 10~50분, 휴식은 3~15분 안에서만 바꾼다.
+RECENT = 3
+TARGET_RATE = 2 / 3
+
+# 요일/시간대 성공률 하나는 최대 CONTEXT_WEIGHT 세션만큼 센다.
+# 그 칸의 기록이 CONTEXT_MIN 세션보다 적으면 그만큼 덜 센다 (기록이 없으면 최근 3세션만 본다)
+CONTEXT_WEIGHT = 1.5
+CONTEXT_MIN = 5
+
+
+def _adjust(success_rate, total_focus, total_break):
+    # 너무 짧은 시간일 경우 자동 조정 제외
+    if total_focus < 60 or total_break < 60:
+        return None
+
+    if success_rate is None:
+        return None
+
+    focus = total_focus
+    brk = total_break
+
+    if success_rate >= TARGET_RATE:
+        focus = min(focus + 60, 50 * 60)
+        brk = max(brk - 60, 3 * 60)
+    else:
+        focus = max(focus - 60, 10 * 60)
+        brk = min(brk + 60, 15 * 60)
+    return focus, brk
+
+
+# ===== 💾 세션 성공 기록 (사용자별, 크기 고정) =====
+# 원본은 날짜별 기록의 세션에 남긴 "success"/"hour" 다 (storage.save_session_result(success=...)).
+# 추천에 쓰는 최근 RING 개와 요일별/시간대별 (성공 수, 전체 수)는 user_sessions.outcomes.json 에 모아 두고,
+# 링에 넣고 뺄 때 함께 고쳐 두므로 추천값과 성공률은 기록을 다시 훑지 않고 O(1) 로 나온다.
+# 이 파일은 원본에서 다시 만들 수 있는 캐시다. 만들 때의 저장소 signature 를 같이 적어 두고,
+# 파일이 없거나 저장소가 그 뒤로 바뀌었으면(다른 스크립트/프로세스의 저장 등) 원본으로 다시 만든다.
+# 칸마다 [날짜, 시, 성공 여부] (요일은 날짜에서 구한다. 빈 칸은 None)
+RING = 256
+
+
+def empty_model():
+    return {
+        "next": 0,
+        "ring": [None] * RING,
+        "weekday": [[0, 0] for _ in range(7)],
+        "hour": [[0, 0] for _ in range(24)],
+        "source": None,
+    }
+
+
+def _count(model, slot, delta):
+    date_str, hour, success = slot
+    for counter in (model["weekday"][date.fromisoformat(date_str).weekday()], model["hour"][hour]):
+        counter[0] += delta if success else 0
+        counter[1] += delta
+
+
+# 결과 하나를 링에 넣는다 (가장 오래된 칸은 빠진다)
+def _push(model, slot):
+    ring, position = model["ring"], model["next"]
+    if ring[position] is not None:
+        _count(model, ring[position], -1)
+    ring[position] = slot
+    _count(model, slot, 1)
+    model["next"] = (position + 1) % RING
+
+
+# 저장소 signature 를 JSON 으로 저장했다가 읽었을 때와 같은 모양으로
+def _source(store):
+    return json.loads(json.dumps(storage.flush(store).signature()))
+
+
+# 날짜별 기록의 성공 여부가 있는 세션으로 모델 만들기
+def rebuild_model(user=None):
+    model = empty_model()
+    for entry in storage.load_session_data(user=user):
+        for s in entry["sessions"]:
+            if "success" in s:
+                _push(model, [entry["date"], s["hour"], s["success"]])
+    return model
+
+
+class OutcomeModel:
+    def __init__(self, user=None):
+        self.user = user
+        self.path = os.path.abspath(outcomes_path(storage.data_path(user)))
+        self._lock = threading.Lock()
+        self.model = self._load()
+
+    # 저장된 모델이 저장소와 맞으면 그대로, 아니면 원본으로 다시 만든다 (읽기만 하므로 파일은 쓰지 않는다)
+    def _load(self):
+        if not storage.has_data(self.user):
+            return empty_model()
+        model = read_model(self.path)
+        if model is None or model["source"] != _source(storage.get_store(user=self.user)):
+            model = rebuild_model(self.user)
+        return model
+
+    # 세션 하나를 원본 기록에 저장하고 (성공 여부 포함) 모델에도 넣어 파일에 저장
+    def record(self, success, minutes, now=None):
+        now = now or datetime.now()
+        slot = [now.strftime("%Y-%m-%d"), now.hour, bool(success)]
+        store = storage.get_store(user=self.user)  # 사용자 폴더는 여기서 처음 만든다
+        with locked(self._lock, self.path):
+            # 다른 탭/프로세스가 그 사이 저장했을 수 있으므로 파일을 다시 읽는다
+            saved = read_model(self.path)
+            before = _source(store)
+            storage.save_session_result(minutes, user=self.user, success=success, now=now)
+            if saved is not None and saved["source"] == before:
+                _push(saved, slot)
+                self.model = saved
+            else:
+                # 파일이 없거나 어긋났으면 방금 저장한 세션까지 원본으로 다시 만든다
+                self.model = rebuild_model(self.user)
+            self.model["source"] = _source(store)
+            atomic_write(self.path, json.dumps(self.model, separators=(",", ":")))
+
+    # 가장 최근 결과 count 개 (최근 것부터)
+    def recent(self, count=RECENT):
+        ring, position = self.model["ring"], self.model["next"]
+        slots = (ring[(position - 1 - i) % RING] for i in range(count))
+        return [slot[2] for slot in slots if slot is not None]
+
+    # 최근 RECENT 세션과 지금 요일/시간대의 지난 성공률을 합친 성공률. 기록이 없으면 None
+    def success_rate(self, now=None):
+        recent = self.recent()
+        if not recent:
+            return None
+        successes, weight = float(sum(recent)), float(len(recent))
+        for rate, count in self.rate_at(now):
+            if count:
+                w = CONTEXT_WEIGHT * min(1.0, count / CONTEXT_MIN)
+                successes += rate * w
+                weight += w
+        return successes / weight
+
+    # 다음 (집중 초, 휴식 초). 기록이 없거나 조정하지 않으면 None
+    def recommend(self, total_focus, total_break, now=None):
+        return _adjust(self.success_rate(now), total_focus, total_break)
+
+    # 지금 요일/시간대의 (성공률, 전체 수) 두 쌍
+    def rate_at(self, now=None):
+        now = now or datetime.now()
+        weekday, hour = self.model["weekday"][now.weekday()], self.model["hour"][now.hour]
+        return (_rate(weekday), weekday[1]), (_rate(hour), hour[1])
+
+
+def _rate(counter):
+    return counter[0] / counter[1] if counter[1] else None
+
+
+def outcomes_path(data_path):
+    return os.path.splitext(data_path)[0] + ".outcomes.json"
+
+
+# 저장된 모델. 없거나 깨졌거나 링 크기가 다르거나 저장소 signature 가 없는 예전 파일이면 None
+def read_model(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            model = json.load(f)
+        if (len(model["ring"]) == RING and len(model["weekday"]) == 7 and len(model["hour"]) == 24
+                and "source" in model):
+            return model
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+_models = OrderedDict()
+_models_lock = threading.Lock()
+
+
+# 사용자별 모델 (프로세스당 처음 한 번만 파일을 읽는다). 저장소처럼 storage.MAX_OPEN_STORES 개만 들고 있는다
+def get_model(user=None):
+    path = os.path.abspath(outcomes_path(storage.data_path(user)))
+    with _models_lock:
+        if path not in _models:
+            _models[path] = OutcomeModel(user)
+        _models.move_to_end(path)
+        while len(_models) > storage.MAX_OPEN_STORES:
+            _models.popitem(last=False)
+        return _models[path]
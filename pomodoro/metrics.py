@@ -0,0 +1,340 @@
+import atexit
+import bisect
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import weakref
+from datetime import datetime
+
+from .clock import now
+from .timer import BREAK, FOCUS, IDLE
+
+# ===== 📈 계측 (켤 때만) =====
+# 느려질 때 어디가 느린지 보려고 자주 도는 경로의 시간/크기를 프로세스 안에서 모은다.
+#   POMODORO_METRICS=1             재기 + 단계 전환마다 JSON 로그 한 줄 (stderr, 로거 pomodoro.metrics)
+#   POMODORO_METRICS_FILE=경로      FILE_SECONDS 마다 (그리고 종료할 때) Prometheus 텍스트 형식으로 쓴다
+#   POMODORO_METRICS_PORT=9108     http://<서버>:9108/metrics 로 내보낸다
+# FILE/PORT 를 주면 POMODORO_METRICS 없이도 켜진다.
+# 끄면 timed 는 원래 함수를 그대로 돌려주고 나머지 함수는 바로 돌아간다 (재는 비용 없음).
+METRICS_FILE = os.environ.get("POMODORO_METRICS_FILE", "")
+METRICS_PORT = int(os.environ.get("POMODORO_METRICS_PORT", "0") or 0)
+ENABLED = os.environ.get("POMODORO_METRICS", "") not in ("", "0") or bool(METRICS_FILE) or bool(METRICS_PORT)
+FILE_SECONDS = 10.0
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LATENESS_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+BYTES_BUCKETS = (128, 256, 512, 1024, 2048, 4096, 16384, 65536)
+
+logger = logging.getLogger("pomodoro.metrics")
+
+_lock = threading.Lock()
+_metrics = []
+_collectors = []
+
+
+# ===== 지표 (라벨별 값) =====
+def _key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _bound(bound):
+    return "+Inf" if bound == float("inf") else f"{bound:g}"
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self, name, help):
+        self.name = name
+        self.help = help
+        self.values = {}
+        _metrics.append(self)
+
+    def set(self, value, **labels):
+        with _lock:
+            self.values[_key(labels)] = value
+
+    def lines(self):
+        for key, value in self.values.items():
+            yield f"{self.name}{_format(key)} {value}"
+
+
+class Counter(Gauge):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = _key(labels)
+        with _lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+# 라벨마다 [구간별 개수 ..., +Inf 구간 개수, 합, 전체 개수]. 내보낼 때 누적으로 바꾼다
+class Histogram(Gauge):
+    kind = "histogram"
+
+    def __init__(self, name, help, buckets):
+        super().__init__(name, help)
+        self.buckets = buckets
+
+    def observe(self, value, **labels):
+        key = _key(labels)
+        with _lock:
+            slot = self.values.get(key)
+            if slot is None:
+                slot = self.values[key] = [0] * (len(self.buckets) + 3)
+            slot[bisect.bisect_left(self.buckets, value)] += 1
+            slot[-2] += value
+            slot[-1] += 1
+
+    def lines(self):
+        for key, slot in self.values.items():
+            total = 0
+            for bound, count in zip(self.buckets + (float("inf"),), slot):
+                total += count
+                yield f"{self.name}_bucket{_format(key, (('le', _bound(bound)),))} {total}"
+            yield f"{self.name}_sum{_format(key)} {slot[-2]:.6f}"
+            yield f"{self.name}_count{_format(key)} {slot[-1]}"
+
+
+SCRIPT_RUN = Histogram("pomodoro_script_run_seconds", "진입 스크립트 한 번 실행 시간 (앱 전체 rerun)", SECONDS_BUCKETS)
+TIMER_AREA_RUN = Histogram("pomodoro_timer_area_run_seconds", "타이머 영역(fragment) 실행 시간 (단계 전환 처리 전까지)",
+                           SECONDS_BUCKETS)
+COUNTDOWN_RENDER = Histogram("pomodoro_countdown_render_seconds", "카운트다운 컴포넌트 호출 시간", SECONDS_BUCKETS)
+COUNTDOWN_PAYLOAD = Histogram("pomodoro_countdown_payload_bytes", "카운트다운 컴포넌트로 넘기는 값 (JSON 바이트)",
+                              BYTES_BUCKETS)
+STORAGE_CALL = Histogram("pomodoro_storage_seconds", "저장/조회 함수 시간", SECONDS_BUCKETS)
+CHECK_LATENESS = Histogram("pomodoro_check_lateness_seconds", "주기 확인 간격이 정한 간격보다 늦은 초", LATENESS_BUCKETS)
+PHASE_LATENESS = Histogram("pomodoro_phase_end_lateness_seconds", "마감 시각부터 단계 전환을 처리할 때까지 초",
+                           LATENESS_BUCKETS)
+TRANSITIONS = Counter("pomodoro_phase_transitions_total", "단계 전환 수")
+
+
+# ===== 내보내기 =====
+# Prometheus 텍스트 형식 전체
+def render():
+    out = []
+    with _lock:
+        for metric in _metrics:
+            out.append(f"# HELP {metric.name} {metric.help}")
+            out.append(f"# TYPE {metric.name} {metric.kind}")
+            out.extend(metric.lines())
+    for collect in _collectors:
+        out.extend(collect())
+    return "\n".join(out) + "\n"
+
+
+def write_file(path=None):
+    path = path or METRICS_FILE
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(render())
+    os.replace(tmp, path)
+
+
+def _write_loop():
+    while True:
+        time.sleep(FILE_SECONDS)
+        try:
+            write_file()
+        except OSError as e:
+            logger.warning("지표 파일 쓰기 실패: %s", e)
+
+
+# /metrics 만 받는 HTTP 처리기 (포트를 줄 때만 http.server 를 가져온다)
+def _handler():
+    from http.server import BaseHTTPRequestHandler
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+    return Handler
+
+
+# 로그 핸들러, 파일 쓰기 스레드, /metrics 서버 (import 때 한 번)
+def _start():
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    if METRICS_FILE:
+        threading.Thread(target=_write_loop, name="pomodoro-metrics-file", daemon=True).start()
+        atexit.register(write_file)
+    if METRICS_PORT:
+        from http.server import ThreadingHTTPServer
+        try:
+            server = ThreadingHTTPServer(("", METRICS_PORT), _handler())
+        except OSError as e:
+            # 같은 포트를 이미 다른 프로세스가 쓰는 경우. 재기는 계속한다
+            logger.warning("지표 서버를 열 수 없음 (포트 %s): %s", METRICS_PORT, e)
+        else:
+            server.daemon_threads = True
+            threading.Thread(target=server.serve_forever, name="pomodoro-metrics-http", daemon=True).start()
+
+
+# ===== 재는 곳 =====
+# 저장/조회 함수 시간 (꺼져 있으면 함수를 그대로 돌려준다)
+def timed(op):
+    def wrap(func):
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                STORAGE_CALL.observe(time.perf_counter() - started, op=op)
+        return wrapper
+    return wrap
+
+
+# 진입 스크립트 맨 위에서 run_started(), 맨 끝에서 run_finished(스크립트 이름).
+# Streamlit 은 세션마다 스크립트를 자기 스레드에서 돌리므로 시작 시각은 스레드별로 둔다.
+# st.rerun/st.stop 으로 중간에 끝난 실행은 세지 않는다.
+_run = threading.local()
+
+
+def run_started():
+    if ENABLED:
+        _run.started = time.perf_counter()
+
+
+def run_finished(script):
+    started = getattr(_run, "started", None) if ENABLED else None
+    if started is not None:
+        SCRIPT_RUN.observe(time.perf_counter() - started, script=script)
+        _run.started = None
+
+
+# 카운트다운 컴포넌트 호출 시간과 넘긴 값 크기
+def countdown_rendered(seconds, args):
+    if not ENABLED:
+        return
+    COUNTDOWN_RENDER.observe(seconds)
+    COUNTDOWN_PAYLOAD.observe(len(json.dumps(args, ensure_ascii=False).encode("utf-8")))
+
+
+# 화면에 있는 타이머 (세션이 끝나 session_state 가 사라지면 같이 빠진다)
+_timers = weakref.WeakSet()
+_last_check = weakref.WeakKeyDictionary()
+
+
+# 타이머 영역이 한 번 돌았을 때. periodic 이면 주기 확인(run_every)으로 돈 것이고,
+# 이전 실행과의 간격이 interval 보다 얼마나 늦었는지 잰다 (다른 실행은 간격의 기준만 새로 잡는다)
+def timer_area_ran(timer, seconds, periodic, interval):
+    if not ENABLED:
+        return
+    TIMER_AREA_RUN.observe(seconds, periodic=str(periodic).lower())
+    at = now()
+    with _lock:
+        _timers.add(timer)
+        last = _last_check.get(timer)
+        if timer.running:
+            _last_check[timer] = at
+        else:
+            _last_check.pop(timer, None)
+    if periodic and last is not None:
+        CHECK_LATENESS.observe(max(0.0, at - last - interval))
+
+
+def _timer_lines():
+    counts = {IDLE: 0, FOCUS: 0, BREAK: 0}
+    running = 0
+    with _lock:
+        timers = list(_timers)
+    for timer in timers:
+        counts[timer.phase] = counts.get(timer.phase, 0) + 1
+        running += timer.running
+    yield "# HELP pomodoro_timers 단계별 타이머 수 (열린 세션)"
+    yield "# TYPE pomodoro_timers gauge"
+    for phase, count in counts.items():
+        yield f'pomodoro_timers{{phase="{phase}"}} {count}'
+    yield "# HELP pomodoro_timers_running 진행 중인 타이머 수"
+    yield "# TYPE pomodoro_timers_running gauge"
+    yield f"pomodoro_timers_running {running}"
+
+
+# 단계 전환 하나 (전환 수, 마감 시각부터 늦은 정도, JSON 로그 한 줄)
+def phase_transition(timer, result, previous, lateness, focus_used):
+    if not ENABLED or result is None:
+        return
+    TRANSITIONS.inc(result=result)
+    if lateness is not None:
+        PHASE_LATENESS.observe(max(0.0, lateness), result=result)
+    logger.info(json.dumps({
+        "event": "phase_transition",
+        "time": datetime.now().isoformat(timespec="milliseconds"),
+        "result": result,
+        "from": previous,
+        "to": timer.phase,
+        "session": timer.session_count,
+        "goal": timer.session_goal,
+        "lateness_s": None if lateness is None else round(lateness, 3),
+        "focus_used_s": round(focus_used, 1),
+    }, ensure_ascii=False))
+
+
+# 저장 방식별 기록 파일 크기 (저장할 때마다 그 저장소 파일 크기를 다시 잰다)
+_data_files = {}
+
+
+def data_file_written(store):
+    if not ENABLED:
+        return
+    size = sum(signature[1] for signature in store.signature() if signature)
+    with _lock:
+        _data_files[store.path] = (type(store).__name__, size)
+
+
+def _data_file_lines():
+    with _lock:
+        files = list(_data_files.values())
+    by_store = {}
+    for name, size in files:
+        by_store.setdefault(name, []).append(size)
+    yield "# HELP pomodoro_data_file_bytes 기록 파일 크기 (저장 방식별 가장 큰 것 / 합)"
+    yield "# TYPE pomodoro_data_file_bytes gauge"
+    for name, sizes in by_store.items():
+        yield f'pomodoro_data_file_bytes{{store="{name}",stat="max"}} {max(sizes)}'
+        yield f'pomodoro_data_file_bytes{{store="{name}",stat="sum"}} {sum(sizes)}'
+    yield "# HELP pomodoro_data_files 크기를 잰 기록 파일 수"
+    yield "# TYPE pomodoro_data_files gauge"
+    for name, sizes in by_store.items():
+        yield f'pomodoro_data_files{{store="{name}"}} {len(sizes)}'
+
+
+_collectors.extend([_timer_lines, _data_file_lines])
+
+if ENABLED:
+    _start()
@@ -0,0 +1,115 @@
+import math
+
+# ===== 📐 세션 시간 분포 스케치 =====
+# 세션 시간(분)을 상대 오차 ALPHA 이내의 로그 구간으로 센다 (DDSketch 방식).
+#   - 추가: 구간 번호 하나 계산 + 개수 1 증가 (O(1))
+#   - 크기: 구간 수는 값의 범위로만 정해진다 (1분~10시간이면 ALPHA=1% 기준 최대 약 320칸, 실제로는 수십 칸).
+#     세션이 몇 개든, 기간이 며칠이든 늘지 않는다.
+#   - 합치기: 같은 구간끼리 개수를 더하면 된다. 그래서 날짜별로 따로 세어 두고 최근 14일만 합칠 수 있다
+#     (P² 같은 합칠 수 없는 추정기는 14일이 지나간 날짜를 빼낼 수 없다).
+# 스케치는 JSON 으로 저장하므로 {"구간 번호": 개수} 형태의 dict 이다.
+ALPHA = 0.01
+_GAMMA = (1 + ALPHA) / (1 - ALPHA)
+_LOG_GAMMA = math.log(_GAMMA)
+
+# 로버스트 추천값에서 쓰는 상수
+TRIM = 0.1          # trimmed: 양쪽 끝에서 10% 씩 버린다
+QUANTILE = 0.84     # quantile: 정규분포에서 평균 + 표준편차에 해당하는 분위수
+MAD_SCALE = 1.4826  # median_mad: MAD 를 표준편차 크기로 맞추는 배수
+
+
+def bucket_key(minutes):
+    return str(math.ceil(math.log(minutes) / _LOG_GAMMA))
+
+
+# 구간의 대표값 (구간 안 어떤 값과도 상대 오차 ALPHA 이내)
+def bucket_value(key):
+    return 2 * _GAMMA ** int(key) / (_GAMMA + 1)
+
+
+# 0분 이하는 추천 계산에서 빼므로 세지 않는다
+def add(sketch, minutes):
+    if minutes > 0:
+        key = bucket_key(minutes)
+        sketch[key] = sketch.get(key, 0) + 1
+
+
+def merge(sketches):
+    merged = {}
+    for sketch in sketches:
+        for key, count in sketch.items():
+            merged[key] = merged.get(key, 0) + count
+    return merged
+
+
+# 스케치 -> [(대표값, 개수)] 값 오름차순
+def items(sketch):
+    return sorted((bucket_value(key), count) for key, count in sketch.items() if count > 0)
+
+
+# 개수 가중 분위수 (numpy.percentile 의 linear 방식과 같은 위치 계산)
+def quantile(pairs, q):
+    n = sum(count for _, count in pairs)
+    position = q * (n - 1)
+    lower = math.floor(position)
+    low_value = high_value = None
+    seen = 0
+    for value, count in pairs:
+        if low_value is None and lower < seen + count:
+            low_value = value
+        if lower + 1 < seen + count:
+            high_value = value
+            break
+        seen += count
+    if high_value is None:
+        high_value = low_value
+    return low_value + (high_value - low_value) * (position - lower)
+
+
+def _mean_std(pairs):
+    n = sum(count for _, count in pairs)
+    mean = sum(value * count for value, count in pairs) / n
+    variance = sum(count * (value - mean) ** 2 for value, count in pairs) / n
+    return mean, math.sqrt(variance)
+
+
+# ===== 🛡 극단값에 강한 추천값 (분) =====
+# 모두 "보통 세션 길이 + 퍼짐 정도" 를 기존 평균 + 표준편차와 같은 크기로 낸다.
+
+# 중앙값 + 1.4826 * MAD (절반 가까이가 극단값이어도 흔들리지 않음)
+def median_mad(pairs):
+    median = quantile(pairs, 0.5)
+    deviations = {}
+    for value, count in pairs:
+        distance = abs(value - median)
+        deviations[distance] = deviations.get(distance, 0) + count
+    mad = quantile(sorted(deviations.items()), 0.5)
+    return median + MAD_SCALE * mad
+
+
+# 양쪽 끝 TRIM 비율을 버린 나머지의 평균 + 표준편차
+def trimmed(pairs, trim=TRIM):
+    n = sum(count for _, count in pairs)
+    low, high = n * trim, n * (1 - trim)
+    kept = []
+    seen = 0
+    for value, count in pairs:
+        # 이 구간에서 [low, high) 안에 들어가는 개수 (경계 구간은 일부만)
+        weight = min(seen + count, high) - max(seen, low)
+        if weight > 0:
+            kept.append((value, weight))
+        seen += count
+    mean, std = _mean_std(kept or pairs)
+    return mean + std
+
+
+# 분위수 하나 (기본 84%)
+def upper_quantile(pairs, q=QUANTILE):
+    return quantile(pairs, q)
+
+
+ESTIMATORS = {
+    "median_mad": median_mad,
+    "trimmed": trimmed,
+    "quantile": upper_quantile,
+}
@@ -0,0 +1,185 @@
+import json
+import math
+import os
+import threading
+from datetime import date, datetime, timedelta
+
+from . import sketch
+from .storage.locking import atomic_write, locked
+
+# ===== 📊 추천 집중시간용 최근 14일 통계 =====
+# 날짜별 (세션 수, 합, 제곱합)을 14칸 링에 보관한다.
+# 세션 저장 시 한 칸만 고치고, 추천값은 14칸만 더해서 계산하므로 기록 길이와 무관하다.
+# user_sessions.stats.json 으로 저장해 두어 서버를 새로 띄워도 기록 전체를 다시 읽지 않는다.
+# 칸마다 세션 시간 분포 스케치(pomodoro/sketch.py)도 같이 두어서 극단값에 강한 추천값을 고를 수 있다.
+WINDOW_DAYS = 14
+
+# 추천 방식 (배포마다 환경변수로 고름)
+#   mean_std   : 평균 + 표준편차 (기존 방식, 기본값)
+#   median_mad : 중앙값 + 1.4826 * MAD
+#   trimmed    : 양쪽 10% 를 버린 평균 + 표준편차
+#   quantile   : 84% 분위수
+RECOMMENDERS = ("mean_std",) + tuple(sketch.ESTIMATORS)
+RECOMMENDER = os.environ.get("POMODORO_RECOMMENDER", "mean_std")
+
+
+def empty_slot():
+    return [None, 0, 0, 0, {}]
+
+
+# 최근 14일 범위 ("two_weeks_ago <= 날짜 0시 < 지금" 을 만족하는 첫 날짜와 마지막 날짜)
+def recent_window(now=None, days=WINDOW_DAYS):
+    now = now or datetime.now()
+    two_weeks_ago = now - timedelta(days=days)
+    first = two_weeks_ago.date()
+    if two_weeks_ago.time() != datetime.min.time():
+        first += timedelta(days=1)
+    last = now.date()
+    if now.time() == datetime.min.time():
+        last -= timedelta(days=1)
+    return first.strftime("%Y-%m-%d"), last.strftime("%Y-%m-%d")
+
+
+# 기존 계산식 그대로 (평균 + 표준편차, 초 단위)
+def focus_from_durations(durations):
+    if not durations:
+        return None
+    import numpy as np
+    mean = np.mean(durations)
+    std = np.std(durations)
+    return int((mean + std) * 60)
+
+
+class RollingStats:
+    def __init__(self, path, source):
+        self.path = path
+        self.source = source
+        # 칸마다 [날짜, 세션 수, 합, 제곱합, 분포 스케치]
+        self.slots = [empty_slot() for _ in range(WINDOW_DAYS)]
+        self._lock = threading.Lock()
+
+    def _add(self, date_str, minutes):
+        slot = self.slots[date.fromisoformat(date_str).toordinal() % WINDOW_DAYS]
+        if slot[0] is not None and date_str < slot[0]:
+            # 이미 14일 넘게 지난 날짜
+            return
+        if slot[0] != date_str:
+            slot[:] = [date_str, 0, 0, 0, {}]
+        if minutes > 0:
+            slot[1] += 1
+            slot[2] += minutes
+            slot[3] += minutes * minutes
+            sketch.add(slot[4], minutes)
+
+    # 레코드를 저장소에 쓰고 14일 통계에 반영 (세션 레코드만 센다)
+    # 저장과 반영을 같은 잠금 안에서 한다. 그 사이에 다른 프로세스가 rebuild 하면
+    # 같은 세션을 두 번 세게 되기 때문이다.
+    def add_records(self, store, records):
+        with locked(self._lock, self.path):
+            # 다른 프로세스가 그 사이 고쳤을 수 있으므로 파일을 다시 읽는다
+            saved = read_saved(self.path, self.source)
+            in_sync = saved is not None and saved.get("signature") == signature_of(store)
+            store.write(records)
+            if not in_sync:
+                # 저장 후 반영 전에 죽은 프로세스가 있었다 -> 저장소에서 다시 만든다
+                self._rebuild(store)
+                return
+            self.slots = saved["slots"]
+            for r in records:
+                if r["t"] == "s" and r["m"] > 0:
+                    self._add(r["d"], r["m"])
+            self.save(store)
+
+    # 저장소의 날짜별 요약(최근 14일)으로 다시 채우기
+    def rebuild(self, store, now=None):
+        with locked(self._lock, self.path):
+            self._rebuild(store, now)
+
+    def _rebuild(self, store, now=None):
+        start, end = recent_window(now)
+        self.slots = [empty_slot() for _ in range(WINDOW_DAYS)]
+        for row in store.load_summary(start, end):
+            slot = self.slots[date.fromisoformat(row["date"]).toordinal() % WINDOW_DAYS]
+            slot[:] = [row["date"], row["focus_count"], row["total_minutes"], row["sum_squares"], {}]
+        # 분포 스케치는 요약에 없으므로 14일치 세션만 읽어서 채운다
+        for entry in store.load_days(start, end):
+            slot = self.slots[date.fromisoformat(entry["date"]).toordinal() % WINDOW_DAYS]
+            for s in entry["sessions"]:
+                sketch.add(slot[4], s["duration_minutes"])
+        self.save(store)
+
+    # 추천 집중시간 (초). 기록이 없으면 None
+    def adjusted_focus(self, store, now=None, method=None):
+        method = method or RECOMMENDER
+        if method not in RECOMMENDERS:
+            raise ValueError(f"알 수 없는 추천 방식: {method}")
+        start, end = recent_window(now)
+        n = total = squares = 0
+        sketches = []
+        with self._lock:
+            # 다른 프로세스가 저장한 세션도 반영
+            saved = read_saved(self.path, self.source)
+            if saved is not None:
+                self.slots = saved["slots"]
+            for date_str, count, s, q, day_sketch in self.slots:
+                if date_str is not None and start <= date_str <= end:
+                    n += count
+                    total += s
+                    squares += q
+                    sketches.append(day_sketch)
+        if n == 0:
+            return None
+        if method != "mean_std":
+            # 14칸의 스케치를 합쳐서 계산 (세션 수와 상관없이 구간 수만큼만 본다)
+            minutes = sketch.ESTIMATORS[method](sketch.items(sketch.merge(sketches)))
+            return int(minutes * 60)
+
+        # int((mean + std) * 60) 를 정수 연산으로 정확히 계산
+        if isinstance(total, int) and isinstance(squares, int):
+            spread = 3600 * (n * squares - total * total)
+            root = math.isqrt(spread)
+            value, rest = divmod(60 * total + root, n)
+            if root * root != spread or rest != 0:
+                return value
+        # 결과가 정확히 정수에 걸리면 numpy 계산이 한 칸 아래로 떨어질 수 있어서
+        # 기존과 똑같은 값을 내도록 14일치 세션만 읽어 기존 방식으로 계산한다
+        return focus_from_durations(store.durations_between(start, end))
+
+    # 저장소 파일의 (mtime, 크기)를 같이 적어 두어, 저장과 반영 사이에 죽은 경우를 알아챈다
+    def save(self, store):
+        payload = {"source": self.source, "signature": signature_of(store), "slots": self.slots}
+        atomic_write(self.path, json.dumps(payload, ensure_ascii=False))
+
+
+# JSON 으로 저장했다 읽은 값과 비교할 수 있는 형태 (튜플 -> 리스트)
+def signature_of(store):
+    return json.loads(json.dumps(store.signature()))
+
+
+def stats_path(data_path):
+    return os.path.splitext(data_path)[0] + ".stats.json"
+
+
+# 저장된 통계 파일 내용. 없거나 깨졌거나 다른 저장 방식으로 만든 것이면 None
+def read_saved(path, source):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        # 분포 스케치가 없는 예전 형식이면 다시 만든다
+        if (saved["source"] == source and len(saved["slots"]) == WINDOW_DAYS
+                and all(len(slot) == len(empty_slot()) for slot in saved["slots"])):
+            return saved
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+# 저장된 통계 불러오기. 없거나, 마지막 반영 뒤에 저장소가 바뀌었으면 저장소에서 다시 만든다
+def load_stats(store, source):
+    stats = RollingStats(stats_path(store.path), source)
+    saved = read_saved(stats.path, source)
+    if saved is not None and saved.get("signature") == signature_of(store):
+        stats.slots = saved["slots"]
+        return stats
+    stats.rebuild(store)
+    return stats
@@ -0,0 +1,218 @@
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from .. import metrics
+from ..stats import load_stats
+from .json_store import JsonStore
+from .locking import GroupCommit
+from .log_store import LogStore
+from .records import review_record, session_record
+from .sqlite_store import SqliteStore
+from .write_behind import WriteBehind
+
+# ===== JSON 저장 관련 =====
+DATA_PATH = "user_sessions.json"
+
+# 사용자별 기록은 users/<사용자 폴더>/user_sessions.json (+ 같은 폴더의 로그, 요약, 통계, 잠금, db 파일)
+# 사용자마다 파일이 따로라서 한 사용자의 저장/조회가 다른 사용자 파일을 읽거나 잠그지 않는다.
+# 사용자는 "출처:이름" 이고 (users.current_user) 출처가 다르면 이름이 같아도 다른 폴더다.
+USERS_DIR = "users"
+USER_SOURCES = ("login", "header", "param")
+_SAFE_USER = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+# 저장 방식: json(파일 전체 다시 쓰기, 기본값) / log(추가 전용 로그 + 주기적 압축) / sqlite
+STORAGE_MODE = os.environ.get("POMODORO_STORAGE", "json")
+
+# POMODORO_WRITE_BEHIND=1 이면 저장을 메모리 대기열에 넣고 백그라운드 스레드가 모아서 쓴다
+WRITE_BEHIND = os.environ.get("POMODORO_WRITE_BEHIND", "") not in ("", "0")
+
+STORES = {
+    "json": JsonStore,
+    "log": LogStore,
+    "sqlite": SqliteStore,
+}
+
+# 프로세스 안에 열어 두는 저장소 수. 넘으면 가장 오래 안 쓴 저장소(와 그 통계, 쓰기 대기열)를 놓는다
+MAX_OPEN_STORES = 256
+
+_stores = OrderedDict()
+_stats = {}
+_writers = {}
+# _stores_lock 은 위 dict 를 찾고 넣을 때만 잡는다.
+# 저장소/통계를 처음 만드는 일(파일 읽기, 요약/통계 다시 만들기, 파일 잠금 기다리기)은 키별 잠금에서 하므로
+# 한 사용자의 첫 저장/조회가 다른 사용자의 저장/조회를 막지 않는다.
+_stores_lock = threading.Lock()
+_key_locks = {}
+
+
+# "출처:이름" -> 폴더 이름 (login-kim, param-kim). 그대로 쓸 수 없는 이름은 출처까지 포함해 해시한다
+# (u- 로 시작하는 이름도 해시해서 다른 이름의 해시 폴더와 겹치지 않게 한다)
+def user_key(user):
+    source, _, name = user.partition(":")
+    if source not in USER_SOURCES or not name:
+        raise ValueError(f"사용자는 '출처:이름' 형식이어야 합니다 (출처: {', '.join(USER_SOURCES)}): {user}")
+    if _SAFE_USER.fullmatch(name) and not name.startswith("u-"):
+        return f"{source}-{name}"
+    return f"{source}-u-" + hashlib.sha1(user.encode("utf-8")).hexdigest()[:16]
+
+
+# 사용자 없음(None)은 기존 user_sessions.json 을 그대로 쓴다
+def data_path(user=None):
+    if user is None:
+        return DATA_PATH
+    return os.path.join(os.path.dirname(DATA_PATH), USERS_DIR, user_key(user), os.path.basename(DATA_PATH))
+
+
+# 이 사용자가 저장한 적이 있는지 (사용자 폴더는 첫 저장 때 만든다).
+# 읽기만 하는 호출은 저장한 적 없는 사용자에게 파일/폴더를 만들지 않고 빈 결과를 돌려준다
+# (?user= 만 바꿔서 디스크와 저장소 캐시를 끝없이 늘릴 수 없도록).
+def has_data(user=None):
+    return user is None or os.path.isdir(os.path.dirname(data_path(user)))
+
+
+# 같은 파일에는 프로세스 안에서 저장소 하나만 쓴다 (잠금 공유)
+def get_store(path=None, mode=None, user=None):
+    path = path or data_path(user)
+    mode = mode or STORAGE_MODE
+    if mode not in STORES:
+        raise ValueError(f"알 수 없는 저장 방식: {mode}")
+    key = (mode, os.path.abspath(path))
+    store = _cached(_stores, key, lambda: _open_store(mode, key[1]))
+    _touch(key)
+    return store
+
+
+def _open_store(mode, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if mode == "json":
+        _fold_log(path)
+    return STORES[mode](path)
+
+
+# log 방식으로 쓰다가 json 으로 바꾸면 아직 스냅샷에 접지 않은 로그(끝나지 못한 압축 포함)를 먼저 접어 넣는다.
+# 그대로 두면 json 저장소는 로그를 읽지 않으므로 그 기록이 보이지 않는다.
+def _fold_log(path):
+    log = LogStore(path)
+    if os.path.exists(log.log_path) or os.path.exists(log.pending_path):
+        log.compact()
+
+
+# cache[key] 가 없으면 create() 로 만들어 넣는다. 같은 키는 한 번만 만들고, 만드는 동안 다른 키는 기다리지 않는다
+def _cached(cache, key, create):
+    with _stores_lock:
+        if key in cache:
+            return cache[key]
+        lock = _key_locks.setdefault((id(cache), key), threading.Lock())
+    with lock:
+        with _stores_lock:
+            if key in cache:
+                return cache[key]
+        value = create()
+        with _stores_lock:
+            cache[key] = value
+            # 기다리던 스레드는 잠금을 이미 쥐고 있고 다시 보면 cache 에 있으므로 잠금은 바로 지운다
+            _key_locks.pop((id(cache), key), None)
+        return value
+
+
+# 방금 쓴 저장소를 맨 뒤로 보내고, MAX_OPEN_STORES 를 넘으면 오래된 것부터 놓는다
+def _touch(key):
+    released = []
+    closing = []
+    with _stores_lock:
+        if key in _stores:
+            _stores.move_to_end(key)
+        if len(_stores) <= MAX_OPEN_STORES:
+            return
+        while len(_stores) > MAX_OPEN_STORES:
+            released.append(_stores.popitem(last=False)[1])
+        # 놓은 저장소를 이미 들고 있던 호출이 다시 넣은 것까지 함께 정리한다
+        live = set(_stores.values())
+        for store in [s for s in _stats if s not in live]:
+            del _stats[store]
+        for store in [s for s in _writers if s not in live]:
+            closing.append(_writers.pop(store))
+    for writer in closing:
+        if isinstance(writer, WriteBehind):
+            try:
+                writer.close()
+            except Exception:
+                pass  # 남은 레코드는 종료할 때(atexit) 다시 저장을 시도한다
+    # 아직 이 저장소를 들고 있던 호출은 그대로 쓸 수 있다 (sqlite 는 연결을 새로 열고 쓴 뒤 닫는다)
+    for store in released:
+        store.close()
+
+
+# 저장소별 최근 14일 통계 (처음 한 번만 불러온다)
+def get_stats(store=None):
+    store = store or get_store()
+    return _cached(_stats, store, lambda: load_stats(store, type(store).__name__))
+
+
+# 기록 저장 + 14일 통계 반영.
+# 동시에 들어온 저장은 한 묶음으로 처리해 저장소 쓰기와 통계 갱신을 한 번씩만 한다.
+# WRITE_BEHIND 이면 대기열에 넣고 바로 돌아간다.
+def commit(records, store=None):
+    store = store or get_store()
+    _cached(_writers, store, lambda: _writer(store)).submit(records)
+
+
+def _writer(store):
+    stats = get_stats(store)
+    group = GroupCommit(lambda batch: stats.add_records(store, batch))
+    return WriteBehind(group.submit) if WRITE_BEHIND else group
+
+
+# 대기열에 남은 저장을 지금 쓴다 (기록을 읽기 전에 부른다)
+def flush(store=None):
+    store = store or get_store()
+    with _stores_lock:
+        writer = _writers.get(store)
+    if isinstance(writer, WriteBehind):
+        writer.flush()
+    return store
+
+
+# 세션 결과 저장. success 를 주면 성공 여부와 끝난 시각(시)도 함께 남긴다 (test.py 자동 조정)
+@metrics.timed("save_session_result")
+def save_session_result(duration_minutes, user=None, success=None, now=None):
+    now = now or datetime.now()
+    store = get_store(user=user)
+    commit([session_record(now.strftime("%Y-%m-%d"), duration_minutes, success, now.hour)], store)
+    metrics.data_file_written(store)
+
+
+# 리뷰 업데이트 (그날 기록이 없으면 새로 만든다)
+@metrics.timed("update_review")
+def update_review(date_str, review, add_time, user=None):
+    store = get_store(user=user)
+    commit([review_record(date_str, review, add_time)], store)
+    metrics.data_file_written(store)
+
+
+# 날짜별 기록 (user_sessions.json 과 같은 형식)
+def load_session_data(start=None, end=None, newest_first=False, user=None):
+    if not has_data(user):
+        return []
+    return flush(get_store(user=user)).load_days(start, end, newest_first)
+
+
+# 날짜별 요약 (세션 수, 총 시간, 제곱합, 리뷰 여부, 추가 가능 시간), 날짜 오름차순
+def load_summary(start=None, end=None, user=None):
+    if not has_data(user):
+        return []
+    return flush(get_store(user=user)).load_summary(start, end)
+
+
+# 자동 추천시간: 최근 14일 세션 시간의 평균 + 표준편차 (초). 기록이 없으면 None
+# method(기본 POMODORO_RECOMMENDER)로 극단값에 강한 방식을 고를 수 있다 (stats.RECOMMENDERS)
+@metrics.timed("calculate_adjusted_focus")
+def calculate_adjusted_focus(now=None, user=None, method=None):
+    if not has_data(user):
+        return None
+    store = flush(get_store(user=user))
+    return get_stats(store).adjusted_focus(store, now, method)
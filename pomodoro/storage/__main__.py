@@ -0,0 +1,128 @@
+import argparse
+import csv
+import os
+import sys
+
+from . import DATA_PATH, STORES, data_path, get_stats, get_store
+from . import synthetic
+from .records import new_summary
+
+# 사용법
+#   python -m pomodoro.storage compact [--path user_sessions.json] [--mode log]
+#   python -m pomodoro.storage migrate [--path user_sessions.json] [--batch 500]
+#       -> user_sessions.json 을 user_sessions.db (sqlite) 로 옮긴다
+#   python -m pomodoro.storage rebuild-stats [--path user_sessions.json] [--mode json]
+#       -> 추천 집중시간용 최근 14일 통계(user_sessions.stats.json)를 다시 만든다
+#   python -m pomodoro.storage rebuild-summary [--path user_sessions.json] [--mode json]
+#       -> 날짜별 요약이 원본 기록과 어긋났을 때 원본으로 다시 만든다
+#   python -m pomodoro.storage export-summary [--out summary.csv]
+#       -> 날짜별 요약을 CSV 로 내보낸다 (기본은 표준 출력)
+#   python -m pomodoro.storage generate [--years 3 | --days 1000] [--users 10] [--seed 0] [--mode sqlite] ...
+#       -> 부하/규모 테스트용 합성 기록을 만든다 (synthetic.py, 같은 seed 면 같은 기록)
+#          --users N 이면 param:synthetic001 ~ N 사용자별로 만든다 (users/param-synthetic001 ...).
+#          이미 있는 기록은 --force 없이는 덮어쓰지 않는다
+#   --user param:kim 을 주면 --path 대신 그 사용자의 파일(users/param-kim/user_sessions.json)을 쓴다
+#   (사용자는 "출처:이름", 출처는 login / header / param)
+
+
+def migrate(path, batch):
+    # log 저장소로 읽으면 스냅샷만 있는 경우와 로그가 남아 있는 경우 모두 처리된다
+    days = get_store(path, "log").load_days()
+    store = get_store(path, "sqlite")
+    for i in range(0, len(days), batch):
+        store.import_days(days[i:i + batch])
+    print(f"{len(days)}일치 기록을 {store.db_path} 로 옮겼습니다.")
+
+
+def generate(path, mode, days, seed, force, options):
+    # 스냅샷/로그 (sqlite 는 db). sqlite 저장소는 만들 때 db 를 만들므로 저장소를 열기 전에 본다
+    if mode == "sqlite":
+        db_path = os.path.splitext(path)[0] + ".db"
+        files = [db_path, db_path + "-wal", db_path + "-shm"]
+    else:
+        files = get_store(path, mode)._files()
+    existing = [name for name in files if os.path.exists(name)]
+    if existing and not force:
+        raise SystemExit(f"이미 기록이 있습니다: {', '.join(existing)} (덮어쓰려면 --force)")
+    for name in existing:
+        os.remove(name)
+
+    store = get_store(path, mode)
+    entries = synthetic.generate_days(days, seed, **options)
+    if mode == "sqlite":
+        count = synthetic.import_batches(store, entries)
+    else:
+        count = synthetic.write_snapshot(path, entries)
+    print(f"{count}일치 합성 기록: {store.db_path if mode == 'sqlite' else path}")
+
+
+def export_summary(store, out):
+    writer = csv.DictWriter(out, fieldnames=list(new_summary("")))
+    writer.writeheader()
+    writer.writerows(store.load_summary())
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m pomodoro.storage")
+    parser.add_argument("--path", default=DATA_PATH)
+    parser.add_argument("--mode", choices=sorted(STORES), default=None)
+    parser.add_argument("--user", default=None, help="사용자별 기록 (출처:이름, 예: login:kim@example.com)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("compact", help="로그를 스냅샷(user_sessions.json)으로 접어 넣기")
+    migrate_cmd = commands.add_parser("migrate", help="user_sessions.json 을 sqlite 로 옮기기")
+    migrate_cmd.add_argument("--batch", type=int, default=500, help="트랜잭션 하나에 넣을 날짜 수")
+    commands.add_parser("rebuild-stats", help="최근 14일 통계를 저장소 기록으로 다시 만들기")
+    commands.add_parser("rebuild-summary", help="날짜별 요약을 원본 기록으로 다시 만들기")
+    export_cmd = commands.add_parser("export-summary", help="날짜별 요약을 CSV 로 내보내기")
+    export_cmd.add_argument("--out", default=None, help="저장할 CSV 파일 (기본: 표준 출력)")
+    generate_cmd = commands.add_parser("generate", help="부하 테스트용 합성 기록 만들기")
+    span = generate_cmd.add_mutually_exclusive_group()
+    span.add_argument("--years", type=float, default=1.0, help="기록 기간 (년)")
+    span.add_argument("--days", type=int, default=None, help="기록 기간 (일, --years 대신)")
+    generate_cmd.add_argument("--users", type=int, default=0, help="사용자 수 (0이면 --path/--user 하나)")
+    generate_cmd.add_argument("--seed", type=int, default=0)
+    generate_cmd.add_argument("--force", action="store_true", help="이미 있는 기록을 덮어쓰기")
+    for name, default in synthetic.DEFAULTS.items():
+        generate_cmd.add_argument(f"--{name}", type=type(default), default=default)
+    args = parser.parse_args()
+    if args.user is not None:
+        try:
+            args.path = data_path(args.user)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.command == "compact":
+        get_store(args.path, args.mode).compact()
+        print(f"압축 완료: {args.path}")
+    elif args.command == "migrate":
+        migrate(args.path, args.batch)
+    elif args.command == "rebuild-stats":
+        store = get_store(args.path, args.mode)
+        get_stats(store).rebuild(store)
+        print(f"통계 재생성 완료: {args.path}")
+    elif args.command == "rebuild-summary":
+        store = get_store(args.path, args.mode)
+        store.rebuild_summary()
+        get_stats(store).rebuild(store)
+        print(f"요약 재생성 완료: {args.path}")
+    elif args.command == "export-summary":
+        store = get_store(args.path, args.mode)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8", newline="") as f:
+                export_summary(store, f)
+        else:
+            export_summary(store, sys.stdout)
+    elif args.command == "generate":
+        days = args.days or round(args.years * 365.25)
+        options = {name: getattr(args, name) for name in synthetic.DEFAULTS}
+        mode = args.mode or "json"
+        if args.users:
+            for i in range(args.users):
+                path = data_path(f"param:synthetic{i + 1:03d}")
+                generate(path, mode, days, synthetic.user_seed(args.seed, i), args.force, options)
+        else:
+            generate(args.path, mode, days, args.seed, args.force, options)
+
+
+if __name__ == "__main__":
+    main()
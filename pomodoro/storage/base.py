@@ -0,0 +1,69 @@
+# ===== 저장소 공통 인터페이스 =====
+# 모든 저장소(json / log / sqlite)가 같은 메서드를 제공한다.
+#   load_days(start, end, newest_first)  날짜 범위의 기록 (user_sessions.json 형식)
+#   durations_between(start, end)        범위 안의 0분 초과 세션 시간 목록
+#   write(records)                       레코드 반영
+#   compact()                            저장소 정리 (필요 없으면 아무 일도 안 함)
+#   close()                              열어 둔 연결 닫기 (저장소를 놓을 때. 필요 없으면 아무 일도 안 함)
+#   signature()                          데이터 파일들의 (mtime, 크기). 바뀌면 캐시를 버린다
+#   load_summary(start, end)             날짜별 요약 (records.new_summary 형식, 날짜 오름차순)
+#   rebuild_summary()                    원본 기록으로 요약 다시 만들기
+# start/end 는 "YYYY-MM-DD" 문자열이고 양 끝을 포함한다.
+
+
+import os
+
+
+def in_range(date_str, start, end):
+    return (start is None or date_str >= start) and (end is None or date_str <= end)
+
+
+def file_signature(paths):
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            signature.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+
+# 파일 전체를 읽어 오는 저장소용 기본 구현
+class FileStore:
+    def _read_all(self):
+        raise NotImplementedError
+
+    # 날짜 -> 요약 dict
+    def _read_summary(self):
+        raise NotImplementedError
+
+    def _files(self):
+        return [self.path]
+
+    def signature(self):
+        return file_signature(self._files())
+
+    def load_days(self, start=None, end=None, newest_first=False):
+        data = self._read_all()
+        if start is not None or end is not None:
+            data = [entry for entry in data if in_range(entry["date"], start, end)]
+        if newest_first:
+            return sorted(data, key=lambda x: x["date"], reverse=True)
+        return data
+
+    def load_summary(self, start=None, end=None):
+        summary = self._read_summary()
+        return [summary[d] for d in sorted(summary) if in_range(d, start, end)]
+
+    def durations_between(self, start, end):
+        durations = []
+        for entry in self.load_days(start, end):
+            durations.extend([s["duration_minutes"] for s in entry["sessions"] if s["duration_minutes"] > 0])
+        return durations
+
+    def compact(self):
+        pass
+
+    def close(self):
+        pass
@@ -0,0 +1,88 @@
+import json
+import os
+import threading
+
+from .base import FileStore, file_signature
+from .locking import atomic_write, locked
+from .records import apply_record, apply_summary, index_days, summarize_days
+
+
+def read_snapshot(path):
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return []
+
+
+def dump_snapshot(data):
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def summary_path_for(path):
+    return os.path.splitext(path)[0] + ".summary.json"
+
+
+# 스냅샷 파일의 [mtime, 크기] (없으면 None)
+def snapshot_signature(path):
+    signature = file_signature([path])[0]
+    return list(signature) if signature is not None else None
+
+
+# 날짜별 요약 파일. 없거나, 요약을 만든 뒤 스냅샷이 바뀌었으면 None
+# (스냅샷을 바꾸고 요약을 쓰기 전에 죽은 경우)
+def read_summary(path, snapshot_path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        saved = json.load(f)
+    if not isinstance(saved, dict) or saved.get("snapshot") != snapshot_signature(snapshot_path):
+        return None
+    return {row["date"]: row for row in saved["rows"]}
+
+
+# 스냅샷을 바꾼 다음에 부른다
+def write_summary(path, summary, snapshot_path):
+    payload = {"snapshot": snapshot_signature(snapshot_path), "rows": [summary[d] for d in sorted(summary)]}
+    atomic_write(path, json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+
+
+# ===== 단일 JSON 파일 저장소 (기존 방식) =====
+# 저장할 때마다 파일 전체를 읽고 고쳐서 다시 쓴다.
+# 날짜별 요약은 user_sessions.summary.json 에 따로 두고 같은 레코드로 갱신한다.
+# 쓰기는 파일 잠금 안에서 임시 파일 + rename 으로 하므로 읽는 쪽은 잠금 없이 온전한 파일만 본다.
+class JsonStore(FileStore):
+    def __init__(self, path):
+        self.path = path
+        self.summary_path = summary_path_for(path)
+        self._lock = threading.Lock()
+
+    def _read_all(self):
+        return read_snapshot(self.path)
+
+    def _read_summary(self):
+        summary = read_summary(self.summary_path, self.path)
+        if summary is None:
+            with locked(self._lock, self.path):
+                # 다른 쪽에서 저장 중이었다면 잠금을 얻은 뒤에는 맞는 요약이 있다
+                summary = read_summary(self.summary_path, self.path)
+                if summary is None:
+                    summary = summarize_days(read_snapshot(self.path))
+                    write_summary(self.summary_path, summary, self.path)
+        return summary
+
+    def write(self, records):
+        with locked(self._lock, self.path):
+            data = read_snapshot(self.path)
+            summary = read_summary(self.summary_path, self.path)
+            if summary is None:
+                summary = summarize_days(data)
+            index = index_days(data)
+            for record in records:
+                apply_record(data, index, record)
+                apply_summary(summary, record)
+            atomic_write(self.path, dump_snapshot(data))
+            write_summary(self.summary_path, summary, self.path)
+
+    def rebuild_summary(self):
+        with locked(self._lock, self.path):
+            write_summary(self.summary_path, summarize_days(read_snapshot(self.path)), self.path)
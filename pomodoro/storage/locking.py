@@ -0,0 +1,127 @@
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# umask 는 읽으려면 바꿔야 하므로 스레드가 돌기 전에 한 번만 읽어 둔다
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+# ===== 🔒 파일 잠금 / 원자적 쓰기 =====
+# 여러 탭, 여러 Streamlit 프로세스가 같은 파일에 저장해도 기록이 사라지지 않도록
+#   - 읽고-고치고-쓰는 동안 <파일>.lock 에 배타적 advisory lock 을 잡고
+#   - 임시 파일에 쓰고 fsync 한 뒤 rename 으로 한 번에 교체한다
+
+
+@contextmanager
+def file_lock(path):
+    with open(path + ".lock", "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# 프로세스 안의 스레드 잠금 + 프로세스 사이의 파일 잠금
+@contextmanager
+def locked(thread_lock, path):
+    with thread_lock, file_lock(path):
+        yield
+
+
+# 같은 폴더의 임시 파일에 쓰고 fsync 한 뒤 path 로 교체
+def atomic_write(path, payload):
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        # mkstemp 는 0600 으로 만들므로 기존 파일(없으면 umask 기본값) 권한을 따른다
+        os.chmod(tmp_path, _file_mode(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    fsync_dir(folder)
+
+
+def _file_mode(path):
+    try:
+        return os.stat(path).st_mode & 0o777
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+# rename 결과까지 디스크에 남기기 (디렉터리를 열 수 없는 OS 는 건너뜀)
+def fsync_dir(folder):
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class _Ticket:
+    __slots__ = ("records", "done", "error")
+
+    def __init__(self, records):
+        self.records = records
+        self.done = False
+        self.error = None
+
+
+# ===== 저장 묶어서 처리하기 (group commit) =====
+# 동시에 들어온 저장 요청은 대기열에 쌓이고, 먼저 잠금을 잡은 스레드가
+# 쌓인 레코드를 한 번에 flush 한다. 나머지는 자기 레코드가 처리됐는지만 확인하고 돌아간다.
+class GroupCommit:
+    def __init__(self, flush):
+        self._flush = flush
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def submit(self, records):
+        ticket = _Ticket(records)
+        with self._pending_lock:
+            self._pending.append(ticket)
+
+        with self._flush_lock:
+            if not ticket.done:
+                with self._pending_lock:
+                    batch, self._pending = self._pending, []
+                try:
+                    self._flush([record for t in batch for record in t.records])
+                except Exception as e:
+                    for t in batch:
+                        t.error = e
+                for t in batch:
+                    t.done = True
+
+        if ticket.error is not None:
+            raise ticket.error
@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+import threading
+
+from .base import FileStore
+from .locking import fsync_dir, locked
+from .json_store import dump_snapshot, read_snapshot, read_summary, summary_path_for, write_summary
+from .records import apply_record, apply_summary, index_days, summarize_days
+
+# 로그가 이 크기를 넘으면 저장 직후 스냅샷으로 접어 넣는다
+COMPACT_BYTES = 256 * 1024
+
+
+# ===== 추가 전용 로그 저장소 =====
+# user_sessions.json 은 스냅샷으로 그대로 두고, 새 기록은 한 줄짜리 레코드로
+# user_sessions.log.jsonl 끝에 덧붙인다. 저장 한 번의 비용이 기록 길이와 무관하다.
+#
+# 압축(compaction) 순서
+#   1. 로그를 .pending 으로 이름 변경 (이후 저장은 새 로그로 간다)
+#   2. 스냅샷 + pending 을 합쳐 임시 파일에 쓰고, 그 내용의 해시를 .done 에 기록
+#   3. 임시 파일로 스냅샷 교체 -> pending, done 삭제
+# 중간에 죽어도 .done 의 해시가 현재 스냅샷과 같은지로 pending 을 다시 적용할지 판단한다.
+#
+# 날짜별 요약도 같은 구조다: user_sessions.summary.json (스냅샷 기준) + 로그 레코드.
+# 압축 도중 죽었다가 복구할 때는 요약을 새 스냅샷에서 다시 만든다.
+class LogStore(FileStore):
+    def __init__(self, path, compact_bytes=COMPACT_BYTES):
+        self.path = path
+        self.compact_bytes = compact_bytes
+        stem = os.path.splitext(path)[0]
+        self.log_path = stem + ".log.jsonl"
+        self.pending_path = self.log_path + ".pending"
+        self.done_path = self.log_path + ".done"
+        self.summary_path = summary_path_for(path)
+        self._lock = threading.Lock()
+
+    def _files(self):
+        return [self.path, self.log_path, self.pending_path]
+
+    def _read_all(self):
+        with locked(self._lock, self.path):
+            self._recover()
+            data = read_snapshot(self.path)
+            index = index_days(data)
+            for record in read_log(self.log_path):
+                apply_record(data, index, record)
+            return data
+
+    def _read_summary(self):
+        with locked(self._lock, self.path):
+            self._recover()
+            summary = self._snapshot_summary()
+            for record in read_log(self.log_path):
+                apply_summary(summary, record)
+            return summary
+
+    # 스냅샷 기준 요약 (파일이 없으면 스냅샷으로 만든다)
+    def _snapshot_summary(self):
+        summary = read_summary(self.summary_path, self.path)
+        if summary is None:
+            summary = summarize_days(read_snapshot(self.path))
+            write_summary(self.summary_path, summary, self.path)
+        return summary
+
+    def rebuild_summary(self):
+        with locked(self._lock, self.path):
+            self._recover()
+            write_summary(self.summary_path, summarize_days(read_snapshot(self.path)), self.path)
+
+    def write(self, records):
+        lines = "".join(json.dumps(r, ensure_ascii=False, separators=(",", ":")) + "\n" for r in records)
+        payload = lines.encode("utf-8")
+        with locked(self._lock, self.path):
+            with open(self.log_path, "a+b") as f:
+                # 이전 저장이 줄 중간에서 끊겼다면 새 줄에서 시작
+                if f.seek(0, os.SEEK_END) > 0:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        payload = b"\n" + payload
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+                size = f.tell()
+            if size > self.compact_bytes:
+                self._compact()
+
+    def compact(self):
+        with locked(self._lock, self.path):
+            self._compact()
+
+    def _compact(self):
+        self._recover()
+        if not os.path.exists(self.log_path):
+            return
+        os.replace(self.log_path, self.pending_path)
+        self._fold_pending()
+
+    def _fold_pending(self, recovering=False):
+        summary = None if recovering else self._snapshot_summary()
+        data = read_snapshot(self.path)
+        index = index_days(data)
+        for record in read_log(self.pending_path):
+            apply_record(data, index, record)
+            if summary is not None:
+                apply_summary(summary, record)
+        payload = dump_snapshot(data).encode("utf-8")
+
+        tmp_path = self.path + ".tmp"
+        write_synced(tmp_path, payload)
+        write_synced(self.done_path, hashlib.sha1(payload).hexdigest().encode("ascii"))
+        os.replace(tmp_path, self.path)
+        fsync_dir(os.path.dirname(os.path.abspath(self.path)))
+        write_summary(self.summary_path, summary if summary is not None else summarize_days(data), self.path)
+        os.remove(self.pending_path)
+        os.remove(self.done_path)
+
+    # 끝나지 못한 압축 마무리
+    def _recover(self):
+        if not os.path.exists(self.pending_path):
+            return
+        if os.path.exists(self.done_path) and os.path.exists(self.path):
+            with open(self.done_path, "rb") as f:
+                done_hash = f.read().decode("ascii")
+            with open(self.path, "rb") as f:
+                if hashlib.sha1(f.read()).hexdigest() == done_hash:
+                    # 스냅샷 교체까지는 끝났음 (요약은 끝났는지 모르므로 새로 만든다)
+                    write_summary(self.summary_path, summarize_days(read_snapshot(self.path)), self.path)
+                    os.remove(self.pending_path)
+                    os.remove(self.done_path)
+                    return
+        self._fold_pending(recovering=True)
+
+
+# 로그 레코드 읽기 (저장 도중 끊긴 마지막 줄은 건너뜀)
+def read_log(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as f:
+        lines = f.read().split(b"\n")
+    # 마지막 원소는 줄바꿈 뒤의 빈 문자열이거나 끝나지 않은 줄
+    records = []
+    for line in lines[:-1]:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records
+
+
+def write_synced(path, payload):
+    with open(path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
@@ -0,0 +1,97 @@
+# ===== 저장 레코드 =====
+# 모든 저장소는 같은 레코드 목록을 받아서 날짜별 기록(user_sessions.json 형식)에 반영한다.
+#   세션 완료: {"t": "s", "d": "2025-06-05", "m": 25}
+#             성공 여부를 아는 세션(test.py)은 + "ok": true/false, "h": 끝난 시각(시)
+#             -> 날짜별 기록의 세션에 "success", "hour" 로 들어간다 (없는 세션은 키도 없다)
+#   리뷰 갱신: {"t": "r", "d": "2025-06-05", "review": "...", "add": 10}
+
+
+def session_record(date_str, duration_minutes, success=None, hour=None):
+    record = {"t": "s", "d": date_str, "m": duration_minutes}
+    if success is not None:
+        record["ok"] = bool(success)
+        record["h"] = hour
+    return record
+
+
+def review_record(date_str, review, add_time):
+    return {"t": "r", "d": date_str, "review": review, "add": add_time}
+
+
+def new_day(date_str):
+    return {"date": date_str, "sessions": [], "daily_review": "", "addition_time": None}
+
+
+# 날짜 -> 기록 dict 색인 (data 리스트의 원소를 그대로 가리킨다)
+def index_days(data):
+    return {entry["date"]: entry for entry in data}
+
+
+# 레코드 하나를 data/index 에 반영
+def apply_record(data, index, record):
+    entry = index.get(record["d"])
+    if entry is None:
+        entry = new_day(record["d"])
+        data.append(entry)
+        index[record["d"]] = entry
+
+    if record["t"] == "s":
+        session = {
+            "session_number": len(entry["sessions"]) + 1,
+            "duration_minutes": record["m"]
+        }
+        if "ok" in record:
+            session["success"] = record["ok"]
+            session["hour"] = record["h"]
+        entry["sessions"].append(session)
+    elif record["t"] == "r":
+        entry["daily_review"] = record["review"]
+        entry["addition_time"] = record["add"]
+
+
+# ===== 날짜별 요약 =====
+# 세션 수, 0분 초과 세션 수, 총 시간, 제곱합, 리뷰 여부, 추가 가능 시간
+def new_summary(date_str):
+    return {
+        "date": date_str,
+        "session_count": 0,
+        "focus_count": 0,
+        "total_minutes": 0,
+        "sum_squares": 0,
+        "has_review": False,
+        "addition_time": None,
+    }
+
+
+# 레코드 하나를 요약(날짜 -> 요약 dict)에 반영
+def apply_summary(summary, record):
+    row = summary.get(record["d"])
+    if row is None:
+        row = summary[record["d"]] = new_summary(record["d"])
+
+    if record["t"] == "s":
+        row["session_count"] += 1
+        if record["m"] > 0:
+            row["focus_count"] += 1
+            row["total_minutes"] += record["m"]
+            row["sum_squares"] += record["m"] * record["m"]
+    elif record["t"] == "r":
+        row["has_review"] = bool(record["review"])
+        row["addition_time"] = record["add"]
+
+
+# 날짜별 기록 전체로 요약 만들기
+def summarize_days(data):
+    summary = {}
+    for entry in data:
+        row = summary[entry["date"]] = new_summary(entry["date"])
+        for s in entry.get("sessions", []):
+            minutes = s["duration_minutes"]
+            row["session_count"] += 1
+            if minutes > 0:
+                row["focus_count"] += 1
+                row["total_minutes"] += minutes
+                row["sum_squares"] += minutes * minutes
+        row["has_review"] = bool(entry.get("daily_review", ""))
+        row["addition_time"] = entry.get("addition_time", None)
+    return summary
@@ -0,0 +1,232 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from .base import file_signature
+from .records import new_day
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS days (
+    user_id       TEXT NOT NULL,
+    date          TEXT NOT NULL,
+    daily_review  TEXT NOT NULL DEFAULT '',
+    addition_time INTEGER,
+    PRIMARY KEY (user_id, date)
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id               INTEGER PRIMARY KEY,
+    user_id          TEXT NOT NULL,
+    date             TEXT NOT NULL,
+    session_number   INTEGER NOT NULL,
+    duration_minutes INTEGER NOT NULL,
+    success          INTEGER,
+    hour             INTEGER
+);
+CREATE INDEX IF NOT EXISTS sessions_user_date ON sessions (user_id, date, session_number);
+CREATE TABLE IF NOT EXISTS daily_summary (
+    user_id       TEXT NOT NULL,
+    date          TEXT NOT NULL,
+    session_count INTEGER NOT NULL DEFAULT 0,
+    focus_count   INTEGER NOT NULL DEFAULT 0,
+    total_minutes INTEGER NOT NULL DEFAULT 0,
+    sum_squares   INTEGER NOT NULL DEFAULT 0,
+    has_review    INTEGER NOT NULL DEFAULT 0,
+    addition_time INTEGER,
+    PRIMARY KEY (user_id, date)
+);
+"""
+
+# 원본 기록(days + sessions)에서 날짜 범위의 요약을 다시 계산
+REFRESH_SUMMARY = """
+INSERT OR REPLACE INTO daily_summary
+    (user_id, date, session_count, focus_count, total_minutes, sum_squares, has_review, addition_time)
+SELECT d.user_id, d.date,
+       COUNT(s.id),
+       COUNT(CASE WHEN s.duration_minutes > 0 THEN 1 END),
+       COALESCE(SUM(CASE WHEN s.duration_minutes > 0 THEN s.duration_minutes END), 0),
+       COALESCE(SUM(CASE WHEN s.duration_minutes > 0 THEN s.duration_minutes * s.duration_minutes END), 0),
+       d.daily_review != '',
+       d.addition_time
+FROM days d LEFT JOIN sessions s ON s.user_id = d.user_id AND s.date = d.date
+WHERE d.user_id = ? AND d.date BETWEEN ? AND ?
+GROUP BY d.user_id, d.date
+"""
+
+SUMMARY_COLUMNS = ("date", "session_count", "focus_count", "total_minutes", "sum_squares", "has_review", "addition_time")
+
+# 성공 여부 열이 생기기 전에 만든 db 에 더할 열
+SESSION_COLUMNS = {"success": "INTEGER", "hour": "INTEGER"}
+
+DEFAULT_USER = "default"
+
+# 쓰고 돌려받아 다시 쓸 연결 수 (넘치는 연결은 바로 닫는다)
+POOL_SIZE = 4
+
+
+# ===== SQLite 저장소 =====
+# user_sessions.json 대신 user_sessions.db 에 저장한다 (WAL 모드).
+# 날짜 범위 조회와 날짜순 정렬은 (user_id, date) 색인을 탄다.
+# daily_summary 는 write() 와 같은 트랜잭션 안에서 함께 갱신된다.
+class SqliteStore:
+    def __init__(self, path, user_id=DEFAULT_USER):
+        self.path = path
+        self.db_path = os.path.splitext(path)[0] + ".db"
+        self.user_id = user_id
+        self._idle = []
+        self._pool_lock = threading.Lock()
+        self._closed = False
+        with self._connect() as conn, conn:
+            conn.executescript(SCHEMA)
+            existing = {row[1] for row in conn.execute("PRAGMA table_info(sessions)")}
+            for column, kind in SESSION_COLUMNS.items():
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE sessions ADD COLUMN {column} {kind}")
+            # 요약 테이블이 생기기 전에 만든 db
+            has_days = conn.execute("SELECT 1 FROM days WHERE user_id = ? LIMIT 1", (user_id,)).fetchone()
+            has_summary = conn.execute("SELECT 1 FROM daily_summary WHERE user_id = ? LIMIT 1", (user_id,)).fetchone()
+            if has_days and not has_summary:
+                conn.execute(REFRESH_SUMMARY, (user_id, "0000-00-00", "9999-99-99"))
+
+    # 연결은 쓰는 동안만 빌리고 끝나면 돌려받는다.
+    # Streamlit 은 rerun 마다 새 스레드에서 스크립트를 돌리므로 스레드별 연결을 두면 rerun 마다 연결이 쌓인다.
+    # 돌려받은 연결은 POOL_SIZE 개까지 남겨 두고 나머지와 close() 뒤에 돌아온 연결은 닫는다.
+    @contextmanager
+    def _connect(self):
+        with self._pool_lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            yield conn
+        finally:
+            with self._pool_lock:
+                keep = not self._closed and len(self._idle) < POOL_SIZE
+                if keep:
+                    self._idle.append(conn)
+            if not keep:
+                conn.close()
+
+    def close(self):
+        with self._pool_lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def load_days(self, start=None, end=None, newest_first=False):
+        where, params = self._range(start, end)
+        order = "DESC" if newest_first else "ASC"
+        with self._connect() as conn:
+            days = conn.execute(
+                f"SELECT date, daily_review, addition_time FROM days WHERE {where} ORDER BY date {order}",
+                params).fetchall()
+            rows = conn.execute(
+                f"SELECT date, session_number, duration_minutes, success, hour FROM sessions WHERE {where} "
+                "ORDER BY date, session_number", params).fetchall()
+
+        data = []
+        index = {}
+        for date_str, review, add_time in days:
+            entry = new_day(date_str)
+            entry["daily_review"] = review
+            entry["addition_time"] = add_time
+            data.append(entry)
+            index[date_str] = entry
+        for date_str, number, minutes, success, hour in rows:
+            session = {"session_number": number, "duration_minutes": minutes}
+            if success is not None:
+                session["success"] = bool(success)
+                session["hour"] = hour
+            index[date_str]["sessions"].append(session)
+        return data
+
+    def durations_between(self, start, end):
+        where, params = self._range(start, end)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT duration_minutes FROM sessions WHERE {where} AND duration_minutes > 0 "
+                "ORDER BY date, session_number", params).fetchall()
+        return [minutes for (minutes,) in rows]
+
+    def load_summary(self, start=None, end=None):
+        where, params = self._range(start, end)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM daily_summary WHERE {where} ORDER BY date",
+                params).fetchall()
+        summary = []
+        for row in rows:
+            item = dict(zip(SUMMARY_COLUMNS, row))
+            item["has_review"] = bool(item["has_review"])
+            summary.append(item)
+        return summary
+
+    def write(self, records):
+        with self._connect() as conn, conn:
+            for record in records:
+                key = (self.user_id, record["d"])
+                conn.execute("INSERT OR IGNORE INTO days (user_id, date) VALUES (?, ?)", key)
+                conn.execute("INSERT OR IGNORE INTO daily_summary (user_id, date) VALUES (?, ?)", key)
+                if record["t"] == "s":
+                    minutes = record["m"]
+                    focused = minutes if minutes > 0 else 0
+                    conn.execute(
+                        "INSERT INTO sessions (user_id, date, session_number, duration_minutes, success, hour) "
+                        "SELECT ?, ?, COUNT(*) + 1, ?, ?, ? FROM sessions WHERE user_id = ? AND date = ?",
+                        key + (minutes, record.get("ok"), record.get("h")) + key)
+                    conn.execute(
+                        "UPDATE daily_summary SET session_count = session_count + 1, "
+                        "focus_count = focus_count + ?, total_minutes = total_minutes + ?, "
+                        "sum_squares = sum_squares + ? WHERE user_id = ? AND date = ?",
+                        (1 if minutes > 0 else 0, focused, focused * focused) + key)
+                elif record["t"] == "r":
+                    conn.execute(
+                        "UPDATE days SET daily_review = ?, addition_time = ? WHERE user_id = ? AND date = ?",
+                        (record["review"] or "", record["add"]) + key)
+                    conn.execute(
+                        "UPDATE daily_summary SET has_review = ?, addition_time = ? WHERE user_id = ? AND date = ?",
+                        (bool(record["review"]), record["add"]) + key)
+
+    def rebuild_summary(self):
+        with self._connect() as conn, conn:
+            conn.execute("DELETE FROM daily_summary WHERE user_id = ?", (self.user_id,))
+            conn.execute(REFRESH_SUMMARY, (self.user_id, "0000-00-00", "9999-99-99"))
+
+    # user_sessions.json 형식의 날짜별 기록을 그대로 넣는다 (같은 날짜는 덮어씀)
+    def import_days(self, days):
+        with self._connect() as conn, conn:
+            for entry in days:
+                key = (self.user_id, entry["date"])
+                conn.execute(
+                    "INSERT OR REPLACE INTO days (user_id, date, daily_review, addition_time) VALUES (?, ?, ?, ?)",
+                    key + (entry.get("daily_review") or "", entry.get("addition_time")))
+                conn.execute("DELETE FROM sessions WHERE user_id = ? AND date = ?", key)
+                conn.executemany(
+                    "INSERT INTO sessions (user_id, date, session_number, duration_minutes, success, hour) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [key + (s["session_number"], s["duration_minutes"], s.get("success"), s.get("hour"))
+                     for s in entry.get("sessions", [])])
+            if days:
+                dates = [entry["date"] for entry in days]
+                conn.execute(REFRESH_SUMMARY, (self.user_id, min(dates), max(dates)))
+
+    def signature(self):
+        return file_signature([self.db_path, self.db_path + "-wal"])
+
+    def compact(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _range(self, start, end):
+        where = "user_id = ?"
+        params = [self.user_id]
+        if start is not None:
+            where += " AND date >= ?"
+            params.append(start)
+        if end is not None:
+            where += " AND date <= ?"
+            params.append(end)
+        return where, params
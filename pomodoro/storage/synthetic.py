@@ -0,0 +1,114 @@
+import json
+import math
+import random
+from datetime import date, timedelta
+
+# ===== 🧪 합성 기록 (부하/규모 테스트용) =====
+# user_sessions.json 과 같은 형식의 날짜별 기록을 날짜 오름차순으로 하나씩 만든다 (generate_days).
+# write_snapshot 은 만들면서 바로 파일에 쓰므로 몇 GB 짜리 기록도 메모리에 올리지 않는다.
+# 같은 seed 면 항상 같은 기록이 나온다 (사용자별 seed 는 user_seed 로 따로 정한다).
+#
+# 하루 기록
+#   - 쉬는 날(rest 확률)은 건너뛴다
+#   - 세션 수: 평균 sessions 인 포아송 분포 (0이면 세션 없이 리뷰만 남는 날)
+#   - 세션 시간: 정규분포(focus, spread) 분. 그중 일부는
+#       zero  : 0분 (바로 멈춤)
+#       short : 1~3분 (포기)
+#       long  : 2~5시간 (끄는 걸 잊음)
+#   - 리뷰(review 확률)와 추가 집중 가능 시간(addition 확률, 0~120분)
+REVIEWS = [
+    "가볍게 시작", "기분 좋은 시작", "좀 졸림", "그래도 채웠다", "나름 만족", "못함", "짧지만 의미있음",
+    "오늘 집중력 좋음", "꾸준히 하고 있음", "무난무난", "조금만 했음", "리듬 다시 잡는 중", "조금 힘듦", "어렵군", "굿굿",
+]
+
+DEFAULTS = {
+    "sessions": 4.0,
+    "focus": 25,
+    "spread": 5,
+    "zero": 0.02,
+    "short": 0.05,
+    "long": 0.02,
+    "rest": 0.15,
+    "review": 0.6,
+    "addition": 0.4,
+}
+
+
+# 사용자마다 다른, 하지만 항상 같은 seed
+def user_seed(seed, index):
+    return seed * 1_000_003 + index
+
+
+def _poisson(rng, mean):
+    # 평균이 작으므로 Knuth 방식으로 충분하다
+    limit, k, p = math.exp(-mean), 0, rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
+
+
+def _duration(rng, options):
+    roll = rng.random()
+    if roll < options["zero"]:
+        return 0
+    roll -= options["zero"]
+    if roll < options["short"]:
+        return rng.randint(1, 3)
+    roll -= options["short"]
+    if roll < options["long"]:
+        return rng.randint(120, 300)
+    return max(1, round(rng.gauss(options["focus"], options["spread"])))
+
+
+# days 일 동안 (end 포함, 기본은 어제까지) 의 날짜별 기록을 하나씩 돌려준다
+def generate_days(days, seed=0, end=None, **options):
+    unknown = set(options) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"알 수 없는 옵션: {', '.join(sorted(unknown))}")
+    options = {**DEFAULTS, **options}
+    rng = random.Random(seed)
+    end = end or date.today() - timedelta(days=1)
+    day = end - timedelta(days=days - 1)
+    for _ in range(days):
+        if rng.random() >= options["rest"]:
+            sessions = [{"session_number": n + 1, "duration_minutes": _duration(rng, options)}
+                        for n in range(_poisson(rng, options["sessions"]))]
+            yield {
+                "date": day.isoformat(),
+                "sessions": sessions,
+                "daily_review": rng.choice(REVIEWS) if rng.random() < options["review"] else "",
+                "addition_time": rng.randint(0, 120) if rng.random() < options["addition"] else None,
+            }
+        day += timedelta(days=1)
+
+
+# 날짜별 기록을 하나씩 받아서 JSON 배열로 바로 쓴다. 쓴 날짜 수를 돌려준다
+def write_snapshot(path, days):
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for entry in days:
+            f.write((",\n" if count else "\n") + json.dumps(entry, ensure_ascii=False))
+            count += 1
+        f.write("\n]\n")
+    return count
+
+
+# 어제까지 days 일 동안 하루도 빠지지 않은 기록을 path 에 바로 쓴다 (벤치마크용)
+def write_history(path, days, seed=0):
+    return write_snapshot(path, generate_days(days, seed, rest=0))
+
+
+# sqlite 저장소에는 batch 일씩 나눠서 넣는다
+def import_batches(store, days, batch=500):
+    count = 0
+    chunk = []
+    for entry in days:
+        chunk.append(entry)
+        if len(chunk) == batch:
+            store.import_days(chunk)
+            count += len(chunk)
+            chunk = []
+    store.import_days(chunk)
+    return count + len(chunk)
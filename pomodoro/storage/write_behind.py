@@ -0,0 +1,90 @@
+import atexit
+import threading
+import time
+
+# 이 시간(초)이 지나거나 이만큼 쌓이면 백그라운드에서 저장한다
+FLUSH_SECONDS = 2.0
+FLUSH_RECORDS = 50
+# 저장에 실패하면 (디스크가 가득 참, 읽기 전용 등) 이 시간부터 두 배씩, RETRY_MAX_SECONDS 까지 기다렸다가 다시 시도한다
+RETRY_MAX_SECONDS = 60.0
+
+
+# ===== 나중에 쓰기 (write-behind) =====
+# submit() 은 레코드를 메모리 대기열에 넣고 바로 돌아간다 (파일 크기와 무관하게 일정한 시간).
+# 백그라운드 스레드가 FLUSH_SECONDS 마다, 또는 FLUSH_RECORDS 개가 쌓이면 한 번에 저장하고,
+# 프로세스가 끝날 때(atexit) 남은 것을 저장한다.
+# 기록을 읽기 전에는 flush() 를 불러 대기열을 비운다 (읽는 쪽은 항상 저장된 최신 기록을 본다).
+class WriteBehind:
+    def __init__(self, write, interval=FLUSH_SECONDS, max_records=FLUSH_RECORDS):
+        self._write = write
+        self.interval = interval
+        self.max_records = max_records
+        self._queue = []
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self.last_error = None
+        atexit.register(self.flush)
+
+    def submit(self, records):
+        with self._cond:
+            closed = self._closed
+            if not closed:
+                self._queue.extend(records)
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="pomodoro-write-behind", daemon=True)
+                    self._thread.start()
+                if len(self._queue) >= self.max_records:
+                    self._cond.notify()
+        # 닫힌 뒤(오래 안 쓴 저장소를 놓은 뒤)에 들어온 저장은 바로 쓴다
+        if closed:
+            self._write(records)
+
+    def pending(self):
+        with self._cond:
+            return len(self._queue)
+
+    # 대기열을 지금 저장 (저장에 실패하면 레코드를 대기열 앞에 되돌리고 예외를 그대로 올린다)
+    def flush(self):
+        with self._flush_lock:
+            with self._cond:
+                batch, self._queue = self._queue, []
+            if not batch:
+                return
+            try:
+                self._write(batch)
+            except Exception:
+                with self._cond:
+                    self._queue[:0] = batch
+                raise
+
+    # 남은 것을 저장하고 스레드를 멈춘다 (그 뒤의 submit 은 바로 저장한다).
+    # 저장에 실패하면 예외를 올리고, 남은 레코드는 종료할 때(atexit) 다시 저장을 시도한다
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def _run(self):
+        delay = 0.0  # 직전 저장이 실패했으면 다음 시도까지 기다릴 초 (그동안은 쌓인 개수와 상관없이 기다린다)
+        while True:
+            with self._cond:
+                deadline = time.monotonic() + (delay or self.interval)
+                while not self._closed and (delay or len(self._queue) < self.max_records):
+                    left = deadline - time.monotonic()
+                    if left <= 0:
+                        break
+                    self._cond.wait(left)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+                self.last_error = None
+                delay = 0.0
+            except Exception as e:
+                # 실패한 묶음은 대기열 앞에 돌아가 있다. 기다렸다가 다시 시도한다
+                self.last_error = e
+                delay = min(max(delay * 2, self.interval, 0.1), RETRY_MAX_SECONDS)
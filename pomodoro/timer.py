@@ -0,0 +1,129 @@
+from .clock import PhaseClock
+
+# ===== 🍅 뽀모도로 타이머 상태 기계 =====
+# Streamlit 없이 돌아가는 순수 파이썬 상태 기계. 네 진입 스크립트가 모두 이것을 쓴다.
+#
+#   idle --start--> focus --phase_end--> break --phase_end--> focus ... (세션 목표까지) --> idle
+#   pause / start 로 멈췄다 이어가고, reset 은 지금 단계를 처음으로, stop 은 idle 로 되돌린다.
+#
+# 저장, 알림 같은 부수 효과는 스크립트가 phase_end() 의 반환값을 보고 처리한다.
+# 시간은 PhaseClock (monotonic 마감 시각) 으로 재고, 모든 메서드의 at 은 테스트용 시각이다.
+IDLE, FOCUS, BREAK = "idle", "focus", "break"
+
+# phase_end() 반환값
+FOCUS_DONE = "focus_done"          # 집중 끝 -> 휴식 시작
+SESSION_DONE = "session_done"      # 휴식 끝 -> 다음 세션 집중 시작
+ALL_DONE = "all_done"              # 휴식 끝 + 세션 목표 달성 -> idle
+
+
+class PomodoroTimer:
+    __slots__ = ("phase", "session_count", "session_goal", "focus_seconds", "break_seconds",
+                 "remaining_focus", "remaining_break", "focus_length", "clock", "token",
+                 "__weakref__")
+
+    def __init__(self, focus_seconds=1500, break_seconds=300, session_goal=1):
+        self.phase = IDLE
+        self.session_count = 0
+        self.session_goal = session_goal
+        # 다음에 시작하는 단계에 쓸 길이 (초)
+        self.focus_seconds = focus_seconds
+        self.break_seconds = break_seconds
+        self.remaining_focus = 0
+        self.remaining_break = 0
+        # 지금 세션의 집중 단계 길이 (사용한 시간 계산용)
+        self.focus_length = 0
+        self.clock = PhaseClock()
+        # 브라우저 카운트다운을 새로 시작할 때마다 1씩 올린다
+        self.token = 0
+
+    @property
+    def running(self):
+        return self.clock.running
+
+    # 설정 바꾸기 (진행 중인 단계는 그대로, 다음 단계부터 적용)
+    def configure(self, focus_seconds, break_seconds, session_goal):
+        self.focus_seconds = focus_seconds
+        self.break_seconds = break_seconds
+        self.session_goal = session_goal
+
+    # 진행 중이면 마감 시각 기준으로 남은 시간 갱신
+    def sync(self, at=None):
+        if not self.running:
+            return
+        if self.phase == FOCUS:
+            self.remaining_focus = self.clock.remaining(at)
+        elif self.phase == BREAK:
+            self.remaining_break = self.clock.remaining(at)
+
+    # 화면에 보여 줄 (남은 초, 단계 길이). idle 이면 다음 집중 시간
+    def display(self, at=None):
+        self.sync(at)
+        if self.phase == FOCUS:
+            return self.remaining_focus, self.clock.duration
+        if self.phase == BREAK:
+            return self.remaining_break, self.clock.duration
+        return self.focus_seconds, self.focus_seconds
+
+    # 이번 세션에서 집중한 초
+    def focus_used(self, at=None):
+        self.sync(at)
+        return self.focus_length - self.remaining_focus
+
+    def start(self, at=None):
+        if self.phase == IDLE:
+            self.session_count = 0
+            self.remaining_break = self.break_seconds
+            self._begin_focus()
+        if not self.running:
+            self.clock.resume(at)
+            self.token += 1
+
+    def pause(self, at=None):
+        self.sync(at)
+        self.clock.pause(at)
+
+    # 지금 단계를 처음으로 (멈춘 상태)
+    def reset(self, at=None):
+        self.pause(at)
+        if self.phase == FOCUS:
+            self._begin_focus()
+        elif self.phase == BREAK:
+            self.remaining_break = self.break_seconds
+            self.clock.set(self.remaining_break)
+
+    def stop(self, at=None):
+        self.pause(at)
+        self.phase = IDLE
+        self.remaining_focus = 0
+        self.remaining_break = 0
+        self.session_count = 0
+
+    # 브라우저 카운트다운이 끝났을 때. 다음 단계는 이전 단계 마감 시각에 이어서 시작한다
+    def phase_end(self, at=None):
+        if self.phase == FOCUS:
+            self.phase = BREAK
+            self.remaining_focus = 0
+            self._next(self.remaining_break, at)
+            return FOCUS_DONE
+
+        if self.phase == BREAK:
+            self.session_count += 1
+            if self.session_count >= self.session_goal:
+                self.phase = IDLE
+                self.clock.set(0)
+                return ALL_DONE
+            self.phase = FOCUS
+            self.remaining_focus = self.focus_length = self.focus_seconds
+            self.remaining_break = self.break_seconds
+            self._next(self.remaining_focus, at)
+            return SESSION_DONE
+        return None
+
+    def _begin_focus(self):
+        self.phase = FOCUS
+        self.remaining_focus = self.focus_length = self.focus_seconds
+        self.clock.set(self.remaining_focus)
+
+    def _next(self, seconds, at):
+        self.clock.next_phase(seconds, at)
+        self.token += 1
@@ -0,0 +1,183 @@
+import os
+import time
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from . import assets, metrics, storage
+from .clock import now
+from .countdown import countdown
+from .timer import ALL_DONE, FOCUS_DONE
+
+# 타이머가 도는 동안 이 간격(초)마다 타이머 영역만 다시 실행해서 마감 시각이 지났는지 확인한다
+# (브라우저 탭이 잠들어 phase_end 가 늦게 오는 경우 대비). 0 이면 확인하지 않는다.
+CHECK_SECONDS = float(os.environ.get("POMODORO_CHECK_SECONDS", "5"))
+
+# ===== 🧩 화면 공용 부품 =====
+# 진입 스크립트는 rerun 마다 처음부터 다시 실행된다.
+# 함수, 긴 CSS 문자열은 여기 두어 프로세스당 한 번만 만든다 (파일에서 읽는 CSS/이미지는 assets.py).
+# 스크립트에는 화면 배치만 남긴다.
+
+# test.py 의 버튼 스타일 (타이머 원형 + 시작/일시정지/초기화/중지 그라데이션 버튼)
+GLOBAL_CSS = """
+<style>
+/* 타이머 원형 스타일 */
+.circle{
+  width:240px;height:240px;border-radius:50%;
+  display:flex;align-items:center;justify-content:center;margin:auto;}
+.circle span{font:700 2.2rem monospace;color:#fff}
+
+/* Streamlit 버튼을 위한 커스텀 CSS */
+div.stButton > button {
+    /* 기본 스타일 */
+    font-size: 18px;
+    font-weight: bold;
+    padding: 12px 28px; /* 패딩 증가 */
+    border: 2px solid; /* 테두리 추가 */
+    border-radius: 12px; /* 모서리 더 둥글게 */
+    margin: 8px;
+    cursor: pointer;
+    transition: all 0.3s ease-in-out; /* 모든 변화에 부드러운 전환 */
+    width: 100%; /* 컬럼 너비에 꽉 차게 */
+    box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2); /* 부드러운 그림자 */
+    text-shadow: 1px 1px 2px rgba(0,0,0,0.1); /* 텍스트 그림자 */
+}
+
+/* 호버 효과 */
+div.stButton > button:hover {
+    transform: translateY(-4px) scale(1.02); /* 살짝 위로 이동하고 커짐 */
+    box-shadow: 0 8px 16px rgba(0, 0, 0, 0.3); /* 그림자 더 진하게 */
+    filter: brightness(1.1); /* 살짝 밝아지게 */
+}
+
+/* 클릭 효과 */
+div.stButton > button:active {
+    transform: translateY(0) scale(1.0); /* 원래 위치로 돌아오며 크기 복원 */
+    box-shadow: 0 2px 4px rgba(0, 0, 0, 0.15); /* 그림자 약하게 */
+}
+
+
+/* 각 버튼별 스타일 (그라데이션 및 색상) - nth-of-type으로 순서대로 지정 */
+
+/* 타이머 시작 버튼 */
+div.stButton > button:nth-of-type(1) {
+    background: linear-gradient(135deg, #007bff, #0056b3); /* 파란색 그라데이션 */
+    color: white;
+    border-color: #004085;
+}
+
+/* 일시정지 버튼 */
+div.stButton > button:nth-of-type(2) {
+    background: linear-gradient(135deg, #ffc107, #e0a800); /* 노란색 그라데이션 */
+    color: #333; /* 어두운 텍스트 색상 */
+    border-color: #cc9900;
+}
+
+/* 타이머 초기화 버튼 */
+div.stButton > button:nth-of-type(3) {
+    background: linear-gradient(135deg, #17a2b8, #138496); /* 청록색 그라데이션 */
+    color: white;
+    border-color: #0f6674;
+}
+
+/* 타이머 중지 버튼 */
+div.stButton > button:nth-of-type(4) {
+    background: linear-gradient(135deg, #dc3545, #c82333); /* 빨간색 그라데이션 */
+    color: white;
+    border-color: #a71d2a;
+}
+</style>
+"""
+
+
+# ===== 🎨 CSS (읽기/줄이기는 assets 에서 한 번만) =====
+def local_css(file_name):
+    st.markdown(assets.css_block(file_name), unsafe_allow_html=True)
+
+
+def inject_css(css):
+    st.markdown(assets.minified_block(css), unsafe_allow_html=True)
+
+
+# ===== 🖼 이미지 버튼 (카운트다운 컴포넌트 안에 그린다) =====
+# countdown(controls=...) 에 넘길 버튼 목록. images: {동작: png 경로}
+# btn_img/ 의 이미지는 브라우저가 캐시하는 정적 주소로 넘긴다
+def image_controls(images):
+    return [{"action": action, "img": assets.image_url(path)} for action, path in images.items()]
+
+
+# ===== ⚙️ 시간 입력 =====
+# 시/분/초 입력 세 개 -> 초. suffix 는 같은 라벨의 위젯을 구분하는 뒤 공백, key 는 위젯 key 앞부분
+def duration_input(max_hours, default_seconds=0, suffix="", key=None):
+    hours, rem = divmod(int(default_seconds), 3600)
+    minutes, seconds = divmod(rem, 60)
+    keys = (f"{key}_hour", f"{key}_min", f"{key}_sec") if key else (None, None, None)
+    hours = st.number_input("Hours" + suffix, 0, max_hours, hours, key=keys[0])
+    minutes = st.number_input("Minutes" + suffix, 0, 59, minutes, key=keys[1])
+    seconds = st.number_input("Seconds" + suffix, 0, 59, seconds, key=keys[2])
+    return hours * 3600 + minutes * 60 + seconds
+
+
+# ===== 💾 기록 저장 =====
+# 집중한 초를 분으로 저장 (min_minutes 보다 짧으면 저장하지 않음)
+def save_focus(seconds, user=None, min_minutes=0):
+    minutes = int(seconds // 60)
+    if minutes < min_minutes:
+        return
+    storage.save_session_result(minutes, user=user)
+
+
+# ===== ⏱ 단계 종료 처리 =====
+# 브라우저 카운트다운이 끝났을 때 다음 단계로 넘기고 알림을 띄운다.
+# 휴식이 끝나 한 세션을 마쳤으면 on_session(이번 세션에 집중한 초) 을 부른다.
+def finish_phase(timer, on_session=None, icons=True):
+    used = timer.focus_used()
+    previous = timer.phase
+    # 마감 시각부터 이 처리까지 늦은 초 (브라우저 이벤트 전달, 잠든 탭, 주기 확인 간격)
+    lateness = now() - timer.clock.deadline if timer.clock.running else None
+    result = timer.phase_end()
+    metrics.phase_transition(timer, result, previous, lateness, used)
+    if result == FOCUS_DONE:
+        st.toast("집중 완료! 쉬는 시간입니다." + (" 🍅" if icons else ""))
+    elif result is not None:
+        st.toast("쉬는 시간이 끝났습니다!" + (" ⏰" if icons else ""))
+        if on_session:
+            on_session(used)
+        if result == ALL_DONE:
+            st.toast("🎉 모든 세션 완료!" if icons else " 모든 세션 완료!", icon="✅")
+    return result
+
+
+# ===== 🔄 타이머 영역 (fragment) =====
+# 카운트다운 컴포넌트와 단계 종료 처리만 fragment 안에서 돈다.
+# 컴포넌트 이벤트와 주기 확인은 이 영역만 다시 실행하고 (사이드바, 입력, 리뷰 폼은 그대로),
+# 앱 전체는 사용자가 입력하거나 세션 수가 바뀔 때(세션 완료, 모든 세션 완료)만 다시 실행한다.
+# on_control(action) 은 컴포넌트 안 버튼(controls)을 눌렀을 때 부른다 (그 뒤 앱 전체를 다시 실행).
+def timer_area(timer, on_session=None, on_control=None, icons=True, **countdown_args):
+    run_every = CHECK_SECONDS if timer.running and CHECK_SECONDS > 0 else None
+    st.fragment(_timer_area, run_every=run_every)(timer, on_session, on_control, icons, countdown_args)
+
+
+def _timer_area(timer, on_session, on_control, icons, countdown_args):
+    started = time.perf_counter()
+    remaining, total = timer.display()
+    event = countdown(remaining, total, timer.running, timer.token, phase=timer.phase, **countdown_args)
+    # 이벤트 없이 fragment 만 다시 돈 것은 run_every 주기 확인
+    metrics.timer_area_ran(timer, time.perf_counter() - started, not event and _fragment_run(), CHECK_SECONDS)
+
+    if event and event["event"] == "control":
+        if on_control:
+            on_control(event["action"])
+        st.rerun()
+
+    # 브라우저 이벤트, 또는 이벤트 없이 마감 시각이 이미 지났을 때
+    if event or (timer.running and timer.clock.remaining() <= 0):
+        result = finish_phase(timer, on_session, icons)
+        # 집중 -> 휴식은 링만 바뀌므로 이 영역만, 세션 수가 바뀌면 앱 전체
+        st.rerun(scope="fragment" if result == FOCUS_DONE and _fragment_run() else "app")
+
+
+# 지금 실행이 fragment 만 다시 실행하는 중인지 (전체 실행 중에는 scope="fragment" 를 쓸 수 없다)
+def _fragment_run():
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.fragment_ids_this_run)
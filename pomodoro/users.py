@@ -0,0 +1,31 @@
+import os
+
+import streamlit as st
+
+# ===== 👤 사용자 구분 =====
+# 로그인(st.login) > 프록시가 넣어 주는 헤더 > ?user= 쿼리 파라미터 순서로 사용자를 정한다.
+# 사용자는 "출처:이름" (login:kim@example.com / header:kim / param:kim) 으로 돌려주고,
+# 저장 위치(storage.user_key)도 출처별로 나뉜다. ?user=kim@example.com 으로 로그인한 kim 의 기록에 들어갈 수 없다.
+# 아무것도 없으면 None (기존처럼 user_sessions.json 하나를 쓴다). 저장 위치는 storage.data_path 참고.
+#   - 헤더는 POMODORO_USER_HEADER 를 줄 때만 본다. 헤더는 브라우저가 마음대로 넣을 수 있으므로
+#     그 헤더를 덮어쓰는 프록시 뒤에서만 켠다.
+#   - ?user= 는 누구나 바꿀 수 있다.
+#   - 로그인을 설정했으면(secrets 의 [auth]) 헤더와 ?user= 는 보지 않는다.
+USER_HEADER = os.environ.get("POMODORO_USER_HEADER", "")
+USER_PARAM = "user"
+
+
+def login_configured():
+    return st.secrets.load_if_toml_exists() and "auth" in st.secrets
+
+
+def current_user():
+    if st.user.get("is_logged_in"):
+        return "login:" + (st.user.get("email") or st.user.get("sub"))
+    if login_configured():
+        return None
+    header = st.context.headers.get(USER_HEADER) if USER_HEADER else None
+    if header and header.strip():
+        return "header:" + header.strip()
+    param = st.query_params.get(USER_PARAM)
+    return "param:" + param if param else None